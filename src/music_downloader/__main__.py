@@ -11,7 +11,7 @@ from http.server import BaseHTTPRequestHandler, HTTPServer
 
 from music_downloader import __version__
 from music_downloader.bot.handlers import create_bot
-from music_downloader.config import Config, setup_logging
+from music_downloader.config import get_config, setup_logging
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +39,7 @@ def _start_health_server(port: int):
 
 def cmd_run(args):
     """Run the Telegram bot with health check endpoint."""
-    config = Config()
+    config = get_config()
     setup_logging(config)
 
     logger.info(f"Music Downloader v{__version__} starting...")
@@ -4,6 +4,7 @@ Telegram bot handlers for music search and download.
 
 import asyncio
 import contextlib
+import functools
 import logging
 import os
 import re
@@ -53,13 +54,33 @@ from music_downloader.processor.flac_analyzer import (
 )
 from music_downloader.search.scorer import ResultScorer
 from music_downloader.search.slskd_client import SearchResult, SlskdClient
-from music_downloader.tools.embed_artwork import embed_artwork_into_file, fetch_spotify_artwork
+from music_downloader.tools.embed_artwork import embed_artwork_into_file, fetch_spotify_artwork, has_artwork
 
 logger = logging.getLogger(__name__)
 
 # Telegram bot API file size limit: 50 MB
 TELEGRAM_FILE_LIMIT = 50 * 1024 * 1024
 
+# Artwork lookups hit the Spotify API and CDN; cap how many run at once
+# so a burst of approvals (e.g. during an import) stays under rate limits.
+_ARTWORK_CONCURRENCY = 4
+
+# Static reply scaffolding, built once at import.  Templates are filled with
+# str.format so only the variable fragments are formatted per message.
+_START_MSG = (
+    "Send me a song name (e.g., `Nancy Sinatra Bang Bang`) "
+    "and I'll find and download it in FLAC.\n\n"
+    "Commands:\n"
+    "/auto — Toggle auto-download mode\n"
+    "/status — Show active downloads\n"
+    "/history — Recent downloads\n"
+    "/help — Show this message"
+)
+
+_DOWNLOADING_TMPL = "⬇️ *Downloading #{num}...*\n{artist} - {title}\nFrom: `{user}`\nFile: `{basename}`"
+
+_RESULT_LINE_TMPL = "*#{num}* {slot} `{duration}` | {quality}{format_tag} | {size_mb:.0f}MB\n    `{basename}`"
+
 
 def _escape_md(text: str) -> str:
     """Escape Markdown V1 special characters for safe display."""
@@ -134,6 +155,7 @@ _VERSION_PAREN_RE = re.compile(
 _QUOTE_CHARS = "'\"‘’“”"
 
 
+@functools.lru_cache(maxsize=4096)
 def _clean_search_title(title: str) -> str:
     """Strip Spotify version suffixes that add noise to Soulseek keyword search."""
     title = _VERSION_SUFFIX_RE.sub("", title)
@@ -217,13 +239,16 @@ _NOISE_WORDS = frozenset(
 )
 
 
+_LATIN_WORD_RE = re.compile(r"[a-zA-Z]{2,}")
+
+
 def _extract_latin_keywords(title: str) -> list[str]:
     """Extract meaningful Latin keywords from a potentially mixed-script title.
 
     Strips common noise words so only distinctive keywords remain,
     e.g. ``["KURENAI"]`` from ``"紅 - KURENAI - シングル… - Single Long Version"``.
     """
-    words = re.findall(r"[a-zA-Z]{2,}", title)
+    words = _LATIN_WORD_RE.findall(title)
     return [w for w in words if w.lower() not in _NOISE_WORDS]
 
 
@@ -255,6 +280,27 @@ class PendingDownload:
 class MusicBot:
     """Telegram bot for music discovery and download."""
 
+    # Callback-data prefix -> handler method name.  Built once per class and
+    # resolved with getattr so instance-level overrides are honoured.
+    _CALLBACK_HANDLERS: dict[str, str] = {
+        "direct": "_handle_direct_search",
+        "ic": "_handle_import_callback",
+        "ix": "_handle_import_callback",
+        "ia": "_handle_import_callback",
+        "ir": "_handle_import_callback",
+        "is": "_handle_import_callback",
+        "retry": "_handle_retry",
+        "next": "_handle_next_result",
+        "dup": "_handle_duplicate_response",
+        "sp_page": "_handle_spotify_page",
+        "sp": "_handle_spotify_selection",
+        "dl_page": "_handle_results_page",
+        "dl": "_handle_download_selection",
+        "approve": "_handle_approval",
+        "reject": "_handle_approval",
+        "auto": "_handle_auto_toggle",
+    }
+
     def __init__(self, config: Config):
         self.config = config
         self.spotify = SpotifyResolver(config.spotify_client_id, config.spotify_client_secret)
@@ -292,6 +338,9 @@ class MusicBot:
         self._chat_generation: dict[int, int] = {}
         # Background tasks (downloads) tracked per chat for cancellation.
         self._active_tasks: dict[int, set[asyncio.Task]] = {}
+        # Artwork embedding runs after the reply, in the background.
+        self._artwork_semaphore = asyncio.Semaphore(_ARTWORK_CONCURRENCY)
+        self._artwork_tasks: set[asyncio.Task] = set()
 
         # Persistence
         self.db = Database(f"{config.data_dir}/importer.db")
@@ -378,16 +427,7 @@ class MusicBot:
         if not await self._check_auth(update):
             return
 
-        await update.message.reply_text(
-            "Send me a song name (e.g., `Nancy Sinatra Bang Bang`) "
-            "and I'll find and download it in FLAC.\n\n"
-            "Commands:\n"
-            "/auto — Toggle auto-download mode\n"
-            "/status — Show active downloads\n"
-            "/history — Recent downloads\n"
-            "/help — Show this message",
-            parse_mode=ParseMode.MARKDOWN,
-        )
+        await update.message.reply_text(_START_MSG, parse_mode=ParseMode.MARKDOWN)
 
     async def cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command."""
@@ -524,7 +564,8 @@ class MusicBot:
         )
 
         try:
-            tracks = self.spotify.search_multiple(query, limit=50)
+            # The rate limiter may sleep until a token frees up; keep that off the loop
+            tracks = await asyncio.to_thread(self.spotify.search_multiple, query, limit=50)
             if self._is_stale(chat_id, generation):
                 return
 
@@ -598,18 +639,26 @@ class MusicBot:
     async def _do_slskd_search(self, context, chat_id: int, track: TrackInfo, searching_msg, generation: int):
         """Search slskd for a resolved Spotify track."""
         try:
-            await _safe_edit(
-                searching_msg,
-                f"🎵 *{track.artist} - {track.title}*\n"
-                f"Album: {track.album} ({track.year})\n"
-                f"Duration: {track.duration_display}\n\n"
-                f"Searching slskd...",
-                parse_mode=ParseMode.MARKDOWN,
+            # Overlap the Telegram status edit with the slskd search round-trip;
+            # the search query does not depend on the edit having landed.
+            edit_task = asyncio.create_task(
+                _safe_edit(
+                    searching_msg,
+                    f"🎵 *{track.artist} - {track.title}*\n"
+                    f"Album: {track.album} ({track.year})\n"
+                    f"Duration: {track.duration_display}\n\n"
+                    f"Searching slskd...",
+                    parse_mode=ParseMode.MARKDOWN,
+                )
             )
 
             clean_title = _clean_search_title(track.title)
             search_query = f"{track.artist} {clean_title}"
-            raw_responses = await self.slskd.search(search_query, timeout_secs=self.config.search_timeout_secs)
+            try:
+                raw_responses = await self.slskd.search(search_query, timeout_secs=self.config.search_timeout_secs)
+            finally:
+                # Later edits must not race the initial one
+                await edit_task
             if self._is_stale(chat_id, generation):
                 return
 
@@ -746,44 +795,26 @@ class MusicBot:
         chat_id = update.effective_chat.id
         data = query.data
 
-        # Dispatch callbacks by prefix
-        prefix = data.split(":", 1)[0]
-        handler = {
-            "direct": self._handle_direct_search,
-            "ic": self._handle_import_callback,
-            "ix": self._handle_import_callback,
-            "ia": self._handle_import_callback,
-            "ir": self._handle_import_callback,
-            "is": self._handle_import_callback,
-            "retry": self._handle_retry,
-            "next": self._handle_next_result,
-            "dup": self._handle_duplicate_response,
-            "sp_page": self._handle_spotify_page,
-            "sp": self._handle_spotify_selection,
-            "dl_page": self._handle_results_page,
-            "dl": self._handle_download_selection,
-            "approve": self._handle_approval,
-            "reject": self._handle_approval,
-        }.get(prefix)
-
-        if handler:
-            await handler(update, context, chat_id, data)
-            return
+        # Dispatch callbacks by prefix (partition avoids building a list)
+        prefix, _, _ = data.partition(":")
+        handler_name = self._CALLBACK_HANDLERS.get(prefix)
+        if handler_name:
+            await getattr(self, handler_name)(update, context, chat_id, data)
 
-        # Auto-mode toggle (inline, no separate handler needed)
-        if data.startswith("auto:"):
-            self.auto_mode = data == "auto:on"
-            mode_str = "ON" if self.auto_mode else "OFF"
-            await query.edit_message_text(
-                f"Auto-download mode: *{mode_str}*",
-                parse_mode=ParseMode.MARKDOWN,
-            )
-            return
+    async def _handle_auto_toggle(self, update, context, chat_id: int, data: str):
+        """Handle the auto-mode toggle buttons."""
+        query = update.callback_query
+        self.auto_mode = data == "auto:on"
+        mode_str = "ON" if self.auto_mode else "OFF"
+        await query.edit_message_text(
+            f"Auto-download mode: *{mode_str}*",
+            parse_mode=ParseMode.MARKDOWN,
+        )
 
     async def _handle_duplicate_response(self, update, context, chat_id: int, data: str):
         """Handle Continue/Cancel response to duplicate detection."""
         query = update.callback_query
-        action = data.split(":", 1)[1]
+        action = data.partition(":")[2]
 
         pending = self.pending.pop(chat_id, None)
 
@@ -807,7 +838,7 @@ class MusicBot:
             return
 
         try:
-            page = int(data.split(":", 1)[1])
+            page = int(data.partition(":")[2])
         except ValueError:
             return
 
@@ -822,7 +853,7 @@ class MusicBot:
     async def _handle_spotify_selection(self, update, context, chat_id: int, data: str):
         """Handle Spotify track selection from multiple results."""
         query = update.callback_query
-        action = data.split(":", 1)[1]
+        action = data.partition(":")[2]
 
         candidates = self._spotify_candidates.pop(chat_id, None)
         self._spotify_page.pop(chat_id, None)
@@ -862,7 +893,7 @@ class MusicBot:
             return
 
         try:
-            page = int(data.split(":", 1)[1])
+            page = int(data.partition(":")[2])
         except ValueError:
             return
 
@@ -888,7 +919,7 @@ class MusicBot:
             await query.edit_message_text("Search expired. Send a new query.")
             return
 
-        action = data.split(":", 1)[1]
+        action = data.partition(":")[2]
 
         if action == "cancel":
             del self.pending[chat_id]
@@ -911,11 +942,12 @@ class MusicBot:
 
         status_msg = await context.bot.send_message(
             chat_id=chat_id,
-            text=(
-                f"⬇️ *Downloading #{index + 1}...*\n"
-                f"{track.artist} - {track.title}\n"
-                f"From: `{result.username}`\n"
-                f"File: `{result.basename}`"
+            text=_DOWNLOADING_TMPL.format(
+                num=index + 1,
+                artist=track.artist,
+                title=track.title,
+                user=result.username,
+                basename=result.basename,
             ),
             parse_mode=ParseMode.MARKDOWN,
         )
@@ -1003,7 +1035,7 @@ class MusicBot:
                 await self._add_history(track, result, "failed")
                 return
 
-            source_path = self.processor.find_downloaded_file(result.username, result.filename)
+            source_path = await asyncio.to_thread(self.processor.find_downloaded_file, result.username, result.filename)
             if not source_path:
                 await status_msg.edit_text(
                     "❌ Downloaded file not found on disk.\nCheck DOWNLOAD_DIR configuration.",
@@ -1185,7 +1217,7 @@ class MusicBot:
     async def _handle_approval(self, update, context, chat_id: int, data: str):
         """Handle approve/reject of a downloaded file."""
         query = update.callback_query
-        action, dl_id = data.split(":", 1)
+        action, _, dl_id = data.partition(":")
 
         pending_dl = self.downloads.pop(dl_id, None)
         if not pending_dl:
@@ -1201,10 +1233,12 @@ class MusicBot:
 
         if action == "approve":
             if pending_dl.source_path:
-                target_path = self.processor.process_file(pending_dl.source_path, track.artist, track.title)
+                target_path = await asyncio.to_thread(
+                    self.processor.process_file, pending_dl.source_path, track.artist, track.title, move=True
+                )
                 if target_path:
-                    self.processor.cleanup_download(pending_dl.source_path)
-                    await self._embed_spotify_artwork(target_path, track)
+                    await asyncio.to_thread(self.processor.cleanup_download, pending_dl.source_path)
+                    self._embed_artwork_in_background(target_path, track)
                     target_name = os.path.basename(target_path)
                     await self._edit_approval_message(query, f"✅ Saved: `{target_name}`")
                     await self._add_history(track, result, "success")
@@ -1534,10 +1568,12 @@ class MusicBot:
         track = pending_dl.track
         result = pending_dl.result
 
-        target_path = self.processor.process_file(pending_dl.source_path, track.artist, track.title)
+        target_path = await asyncio.to_thread(
+            self.processor.process_file, pending_dl.source_path, track.artist, track.title, move=True
+        )
         if target_path:
-            self.processor.cleanup_download(pending_dl.source_path)
-            await self._embed_spotify_artwork(target_path, track)
+            await asyncio.to_thread(self.processor.cleanup_download, pending_dl.source_path)
+            self._embed_artwork_in_background(target_path, track)
             target_name = os.path.basename(target_path)
             await self._edit_approval_message(query, f"✅ Saved: `{target_name}`")
             await self._add_history(track, result, "success")
@@ -1729,7 +1765,7 @@ class MusicBot:
                 await asyncio.to_thread(self.import_repo.update_track_status, track_id, TrackStatus.awaiting_approval)
                 return
 
-            source_path = self.processor.find_downloaded_file(result.username, result.filename)
+            source_path = await asyncio.to_thread(self.processor.find_downloaded_file, result.username, result.filename)
             if not source_path:
                 await _safe_edit(
                     status_msg,
@@ -1801,7 +1837,7 @@ class MusicBot:
     async def _handle_retry(self, update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, data: str):
         """Retry a failed download."""
         query = update.callback_query
-        dl_id = data.split(":", 1)[1]
+        dl_id = data.partition(":")[2]
 
         pending_dl = self.downloads.pop(dl_id, None)
         if not pending_dl:
@@ -1837,7 +1873,7 @@ class MusicBot:
     async def _handle_next_result(self, update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, data: str):
         """Try the next-best search result after a failed download."""
         query = update.callback_query
-        dl_id = data.split(":", 1)[1]
+        dl_id = data.partition(":")[2]
 
         pending = self.pending.get(chat_id) or self._import_pending.get(chat_id)
         pending_dl = self.downloads.pop(dl_id, None)
@@ -1913,14 +1949,29 @@ class MusicBot:
     async def _embed_spotify_artwork(self, filepath: str, track: TrackInfo) -> None:
         """Fetch album artwork from Spotify and embed into the saved file."""
         try:
-            art = await asyncio.to_thread(fetch_spotify_artwork, self.spotify.sp, track.artist, track.title)
-            if art:
-                ok = await asyncio.to_thread(embed_artwork_into_file, filepath, art)
-                if ok:
-                    logger.info("Embedded Spotify artwork into %s (%d KB)", filepath, len(art) // 1024)
+            async with self._artwork_semaphore:
+                # True: already tagged; None: not a file artwork can go into
+                if await asyncio.to_thread(has_artwork, filepath) is not False:
+                    return
+                art = await asyncio.to_thread(fetch_spotify_artwork, self.spotify.sp, track.artist, track.title)
+                if art:
+                    ok = await asyncio.to_thread(embed_artwork_into_file, filepath, art)
+                    if ok:
+                        logger.info("Embedded Spotify artwork into %s (%d KB)", filepath, len(art) // 1024)
         except Exception:
             logger.debug("Artwork embedding failed for %s", filepath, exc_info=True)
 
+    def _embed_artwork_in_background(self, filepath: str, track: TrackInfo) -> None:
+        """Embed artwork without holding up the approval reply or the next import track."""
+        task = asyncio.create_task(self._embed_spotify_artwork(filepath, track))
+        self._artwork_tasks.add(task)
+        task.add_done_callback(self._artwork_tasks.discard)
+
+    async def wait_for_artwork(self) -> None:
+        """Let background artwork embeds still in flight finish (used at shutdown)."""
+        if self._artwork_tasks:
+            await asyncio.gather(*self._artwork_tasks, return_exceptions=True)
+
     # =========================================================================
     # HELPERS
     # =========================================================================
@@ -1997,9 +2048,15 @@ class MusicBot:
             fmt = r.extension.upper()
             format_tag = f" [{fmt}]" if is_fallback else ""
             lines.append(
-                f"*#{i + 1}* {slot_icon} `{r.duration_display}` | "
-                f"{r.quality_display}{format_tag} | {r.size_mb:.0f}MB\n"
-                f"    `{r.basename}`"
+                _RESULT_LINE_TMPL.format(
+                    num=i + 1,
+                    slot=slot_icon,
+                    duration=r.duration_display,
+                    quality=r.quality_display,
+                    format_tag=format_tag,
+                    size_mb=r.size_mb,
+                    basename=r.basename,
+                )
             )
 
         return "\n".join(lines)
@@ -2049,7 +2106,24 @@ def create_bot(config: Config) -> Application:
     """
     bot = MusicBot(config)
 
-    app = Application.builder().token(config.telegram_bot_token).build()
+    async def _warm_up_connections(application: Application) -> None:
+        # Open the slskd keep-alive socket and fetch the Spotify token in the
+        # background so the first user request doesn't pay for either.
+        application.create_task(bot.slskd.ping())
+        application.create_task(asyncio.to_thread(bot.spotify.warm_up))
+
+    async def _stop_watchers(application: Application) -> None:
+        await bot.wait_for_artwork()
+        bot.processor.close()
+        bot.slskd.close()
+
+    app = (
+        Application.builder()
+        .token(config.telegram_bot_token)
+        .post_init(_warm_up_connections)
+        .post_shutdown(_stop_watchers)
+        .build()
+    )
 
     # Command handlers
     app.add_handler(CommandHandler("start", bot.cmd_start))
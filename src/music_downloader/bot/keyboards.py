@@ -10,6 +10,7 @@ from music_downloader.search.slskd_client import SearchResult
 
 def build_results_keyboard(
     results: list[SearchResult],
+    *,
     page: int = 0,
     page_size: int = 10,
 ) -> InlineKeyboardMarkup:
@@ -18,6 +19,9 @@ def build_results_keyboard(
 
     Each button shows: duration | quality | size
     Callback data format: dl:<index>
+
+    ``page`` and ``page_size`` are keyword-only so a stray positional
+    ``max_results`` can never be mistaken for a page number.
     """
     start = page * page_size
     end = min(start + page_size, len(results))
@@ -3,8 +3,10 @@ Configuration management for Music Downloader.
 Loads and validates settings from environment variables.
 """
 
+import functools
 import logging
 import os
+from dataclasses import dataclass, field
 
 from dotenv import load_dotenv
 
@@ -13,85 +15,127 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-class Config:
-    """Configuration settings loaded from environment variables."""
-
-    def __init__(self):
-        """Initialize configuration from environment variables."""
-        # =====================================================================
-        # TELEGRAM BOT
-        # =====================================================================
-        self.telegram_bot_token = self._get_required_env("TELEGRAM_BOT_TOKEN")
-
-        # Comma-separated Telegram user IDs allowed to use the bot
-        # If empty, anyone can use it (not recommended)
-        allowed_users_str = os.getenv("TELEGRAM_ALLOWED_USERS", "")
-        self.telegram_allowed_users = self._parse_id_set(allowed_users_str)
-
-        # =====================================================================
-        # SPOTIFY API (Client Credentials flow — no user login needed)
-        # =====================================================================
-        self.spotify_client_id = self._get_required_env("SPOTIFY_CLIENT_ID")
-        self.spotify_client_secret = self._get_required_env("SPOTIFY_CLIENT_SECRET")
-
-        # =====================================================================
-        # SLSKD (Soulseek) CONNECTION
-        # =====================================================================
-        self.slskd_host = self._get_required_env("SLSKD_HOST")
-        self.slskd_api_key = self._get_required_env("SLSKD_API_KEY")
-
-        # =====================================================================
-        # PATHS
-        # =====================================================================
-        # Where slskd stores completed downloads (mounted volume)
-        self.download_dir = os.getenv("DOWNLOAD_DIR", "/downloads")
-
-        # Where to place the final renamed files (e.g., WCYR-FLAC directory)
-        self.output_dir = os.getenv("OUTPUT_DIR", "/music")
-
-        # Where to store SQLite database (persistent volume)
-        self.data_dir = os.getenv("DATA_DIR", "/data")
-
-        # =====================================================================
-        # DOWNLOAD BEHAVIOR
-        # =====================================================================
-        # Auto-download best match without user confirmation
-        self.auto_mode = os.getenv("AUTO_MODE", "false").lower() == "true"
-
-        # Maximum number of search results to show per page
-        self.max_results = int(os.getenv("MAX_RESULTS", "10"))
-
-        # Duration tolerance in seconds when matching Spotify duration
-        self.duration_tolerance_secs = int(os.getenv("DURATION_TOLERANCE_SECS", "5"))
-
-        # How long to wait for slskd search results (seconds)
-        self.search_timeout_secs = int(os.getenv("SEARCH_TIMEOUT_SECS", "30"))
-
-        # How long to wait for a download to complete (seconds)
-        self.download_timeout_secs = int(os.getenv("DOWNLOAD_TIMEOUT_SECS", "600"))
-
-        # Keywords in file paths that indicate unwanted versions
-        exclude_kw = os.getenv(
-            "EXCLUDE_KEYWORDS",
-            "live,remix,acoustic,karaoke,instrumental,cover,demo,radio edit,tribute,remaster",
+_DEFAULT_EXCLUDE_KEYWORDS = "live,remix,acoustic,karaoke,instrumental,cover,demo,radio edit,tribute,remaster"
+
+
+def _required_env(key: str) -> str:
+    """Get a required environment variable."""
+    value = os.getenv(key)
+    if not value:
+        raise ValueError(
+            f"Required environment variable '{key}' is not set. "
+            "Please set it in your .env file or container environment."
         )
-        self.exclude_keywords = [kw.strip().lower() for kw in exclude_kw.split(",") if kw.strip()]
+    return value
+
+
+def _env_int(key: str, default: str) -> int:
+    """Get an integer environment variable."""
+    return int(os.getenv(key, default))
+
+
+def _env_flag(key: str, default: str = "false") -> bool:
+    """Get a boolean ("true"/"false") environment variable."""
+    return os.getenv(key, default).lower() == "true"
+
+
+def _env_exclude_keywords() -> list[str]:
+    """Parse EXCLUDE_KEYWORDS into a deduplicated, order-preserving list."""
+    exclude_kw = os.getenv("EXCLUDE_KEYWORDS", _DEFAULT_EXCLUDE_KEYWORDS)
+    # Deduplicated (order-preserving); the scorer compiles them into one pattern
+    return list(dict.fromkeys(kw.strip().lower() for kw in exclude_kw.split(",") if kw.strip()))
+
+
+def _env_log_level() -> int:
+    """Parse LOG_LEVEL into a logging level constant."""
+    log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+    if log_level == "WARN":
+        log_level = "WARNING"
+    return getattr(logging, log_level, logging.INFO)
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Configuration settings loaded from environment variables.
+
+    Every field defaults to its environment variable, so ``Config()`` reads
+    the environment while tests can still pass explicit values.  Instances
+    are immutable; use :func:`get_config` to share a single one.
+    """
+
+    # =====================================================================
+    # TELEGRAM BOT
+    # =====================================================================
+    telegram_bot_token: str = field(default_factory=lambda: _required_env("TELEGRAM_BOT_TOKEN"))
+
+    # Comma-separated Telegram user IDs allowed to use the bot
+    # If empty, anyone can use it (not recommended)
+    telegram_allowed_users: set[int] = field(
+        default_factory=lambda: Config._parse_id_set(os.getenv("TELEGRAM_ALLOWED_USERS", ""))
+    )
 
-        # File naming template: {artist} - {title}
-        self.filename_template = os.getenv("FILENAME_TEMPLATE", "{artist} - {title}")
+    # =====================================================================
+    # SPOTIFY API (Client Credentials flow — no user login needed)
+    # =====================================================================
+    spotify_client_id: str = field(default_factory=lambda: _required_env("SPOTIFY_CLIENT_ID"))
+    spotify_client_secret: str = field(default_factory=lambda: _required_env("SPOTIFY_CLIENT_SECRET"))
 
-        # =====================================================================
-        # LOGGING
-        # =====================================================================
-        log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-        if log_level == "WARN":
-            log_level = "WARNING"
-        self.log_level = getattr(logging, log_level, logging.INFO)
+    # =====================================================================
+    # SLSKD (Soulseek) CONNECTION
+    # =====================================================================
+    slskd_host: str = field(default_factory=lambda: _required_env("SLSKD_HOST"))
+    slskd_api_key: str = field(default_factory=lambda: _required_env("SLSKD_API_KEY"))
 
-        # =====================================================================
-        # HEALTH CHECK
-        # =====================================================================
-        self.health_port = int(os.getenv("HEALTH_PORT", "8080"))
+    # =====================================================================
+    # PATHS
+    # =====================================================================
+    # Where slskd stores completed downloads (mounted volume)
+    download_dir: str = field(default_factory=lambda: os.getenv("DOWNLOAD_DIR", "/downloads"))
+
+    # Where to place the final renamed files (e.g., WCYR-FLAC directory)
+    output_dir: str = field(default_factory=lambda: os.getenv("OUTPUT_DIR", "/music"))
+
+    # Where to store SQLite database (persistent volume)
+    data_dir: str = field(default_factory=lambda: os.getenv("DATA_DIR", "/data"))
+
+    # =====================================================================
+    # DOWNLOAD BEHAVIOR
+    # =====================================================================
+    # Auto-download best match without user confirmation
+    auto_mode: bool = field(default_factory=lambda: _env_flag("AUTO_MODE"))
+
+    # Maximum number of search results to show per page
+    max_results: int = field(default_factory=lambda: _env_int("MAX_RESULTS", "10"))
+
+    # Duration tolerance in seconds when matching Spotify duration
+    duration_tolerance_secs: int = field(default_factory=lambda: _env_int("DURATION_TOLERANCE_SECS", "5"))
+
+    # How long to wait for slskd search results (seconds)
+    search_timeout_secs: int = field(default_factory=lambda: _env_int("SEARCH_TIMEOUT_SECS", "30"))
+
+    # How long to wait for a download to complete (seconds)
+    download_timeout_secs: int = field(default_factory=lambda: _env_int("DOWNLOAD_TIMEOUT_SECS", "600"))
+
+    # Keywords in file paths that indicate unwanted versions
+    exclude_keywords: list[str] = field(default_factory=_env_exclude_keywords)
+
+    # File naming template: {artist} - {title}
+    filename_template: str = field(default_factory=lambda: os.getenv("FILENAME_TEMPLATE", "{artist} - {title}"))
+
+    # =====================================================================
+    # LOGGING
+    # =====================================================================
+    log_level: int = field(default_factory=_env_log_level)
+
+    # =====================================================================
+    # HEALTH CHECK
+    # =====================================================================
+    health_port: int = field(default_factory=lambda: _env_int("HEALTH_PORT", "8080"))
+
+    def __post_init__(self):
+        """Validate settings and log a summary."""
+        if self.max_results < 1:
+            raise ValueError(f"MAX_RESULTS must be at least 1 (got {self.max_results})")
 
         logger.info("Configuration loaded successfully")
         if self.auto_mode:
@@ -101,16 +145,6 @@ class Config:
         else:
             logger.warning("TELEGRAM_ALLOWED_USERS is empty — bot will deny all commands until configured")
 
-    def _get_required_env(self, key: str) -> str:
-        """Get a required environment variable."""
-        value = os.getenv(key)
-        if not value:
-            raise ValueError(
-                f"Required environment variable '{key}' is not set. "
-                "Please set it in your .env file or container environment."
-            )
-        return value
-
     @staticmethod
     def _parse_id_set(id_str: str) -> set[int]:
         """Parse comma-separated ID string into a set of integers."""
@@ -119,6 +153,12 @@ class Config:
         return {int(uid.strip()) for uid in id_str.split(",") if uid.strip()}
 
 
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, reading the environment only once."""
+    return Config()
+
+
 def setup_logging(config: Config):
     """Configure logging for the application."""
     logging.basicConfig(
@@ -58,7 +58,8 @@ class PlaylistResolver:
             owner = playlist["owner"]["display_name"]
             spotify_url = playlist["external_urls"].get("spotify", "")
 
-            results = self.spotify.sp.playlist_tracks(playlist_id)
+            # The playlist object already embeds the first page of tracks
+            results = playlist.get("tracks") or self.spotify.sp.playlist_tracks(playlist_id)
             items: list[dict] = []
             while results:
                 items.extend(results["items"])
@@ -108,7 +109,7 @@ class PlaylistResolver:
             year = album.get("release_date", "")[:4]
             spotify_url = album["external_urls"].get("spotify", "")
 
-            results = self.spotify.sp.album_tracks(album_id)
+            results = album.get("tracks") or self.spotify.sp.album_tracks(album_id)
             raw_tracks: list[dict] = []
             while results:
                 raw_tracks.extend(results["items"])
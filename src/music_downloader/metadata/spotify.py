@@ -4,15 +4,101 @@ Uses Client Credentials flow (no user login needed) to look up track metadata.
 """
 
 import logging
-from dataclasses import dataclass
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 
+import requests
 import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Search response cache: track metadata changes rarely, so repeated lookups
+# of the same query are served from memory instead of the Web API.
+_SEARCH_CACHE_MAX_ENTRIES = 1024
+_SEARCH_CACHE_TTL_SECS = 6 * 60 * 60
+_SEARCH_CACHE_STATS_EVERY = 100
 
-@dataclass
+# Client-side request budget, kept below Spotify's ~180 requests/minute so
+# bursts (playlist imports, parallel artwork lookups) never trip a 429.
+# Actual 429s are retried after the server's Retry-After delay.
+_RATE_LIMIT_REQUESTS = 150
+_RATE_LIMIT_PERIOD_SECS = 60.0
+_RATE_LIMIT_BURST = 20
+_HTTP_RETRIES = Retry(
+    total=3,
+    connect=None,
+    read=False,
+    allowed_methods=frozenset({"GET", "POST", "PUT", "DELETE"}),
+    status=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _fuzzy_query_key(query: str) -> tuple[str, ...]:
+    """
+    Case-, order- and punctuation-insensitive form of a search query.
+
+    "Nancy Sinatra - Bang Bang" and "bang bang, nancy sinatra" both become
+    ``("bang", "bang", "nancy", "sinatra")``.  Every word is kept: even
+    "the" or "video" can be the title that tells two searches apart.
+    """
+    return tuple(sorted(_WORD_RE.findall(query.lower())))
+
+
+class _TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is available."""
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            # A negative balance reserves a future token for this caller
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+class _RateLimitedAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter that takes a token from a shared bucket before each request."""
+
+    def __init__(self, bucket: _TokenBucket, **kwargs):
+        self._bucket = bucket
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self._bucket.acquire()
+        return super().send(request, **kwargs)
+
+
+def _build_session() -> requests.Session:
+    """Requests session for spotipy with client-side rate limiting and 429 retries."""
+    bucket = _TokenBucket(_RATE_LIMIT_REQUESTS / _RATE_LIMIT_PERIOD_SECS, _RATE_LIMIT_BURST)
+    adapter = _RateLimitedAdapter(bucket, max_retries=_HTTP_RETRIES)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@dataclass(frozen=True, slots=True)
 class TrackInfo:
     """Resolved track metadata from Spotify."""
 
@@ -22,38 +108,129 @@ class TrackInfo:
     duration_ms: int
     spotify_url: str
     year: str
+    # Read for every scoring pass, result list and status message; built
+    # once here since slots leave no __dict__ for cached_property.
+    _duration_secs: int = field(init=False, repr=False, compare=False)
+    _duration_display: str = field(init=False, repr=False, compare=False)
+    _filename: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        secs = self.duration_ms // 1000
+        mins, rem = divmod(secs, 60)
+        object.__setattr__(self, "_duration_secs", secs)
+        object.__setattr__(self, "_duration_display", f"{mins}:{rem:02d}")
+        object.__setattr__(self, "_filename", f"{self.artist} - {self.title}")
 
     @property
     def duration_secs(self) -> int:
         """Duration in whole seconds."""
-        return self.duration_ms // 1000
+        return self._duration_secs
 
     @property
     def duration_display(self) -> str:
         """Human-readable duration like '2:42'."""
-        mins, secs = divmod(self.duration_secs, 60)
-        return f"{mins}:{secs:02d}"
+        return self._duration_display
 
     @property
     def filename(self) -> str:
         """Standard filename: 'Artist - Title'."""
-        return f"{self.artist} - {self.title}"
+        return self._filename
 
     def __str__(self) -> str:
         return f"{self.artist} - {self.title} ({self.duration_display})"
 
 
+def _slice_tracks(results: dict, limit: int) -> dict:
+    """Return ``results`` trimmed to the first ``limit`` track items."""
+    tracks = results.get("tracks", {})
+    items = tracks.get("items", [])
+    if len(items) <= limit:
+        return results
+    return {**results, "tracks": {**tracks, "items": items[:limit]}}
+
+
 class SpotifyResolver:
     """Resolves track metadata from Spotify."""
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        cache_ttl_secs: float = _SEARCH_CACHE_TTL_SECS,
+        cache_max_entries: int = _SEARCH_CACHE_MAX_ENTRIES,
+    ):
         auth_manager = SpotifyClientCredentials(
             client_id=client_id,
             client_secret=client_secret,
         )
-        self.sp = spotipy.Spotify(auth_manager=auth_manager)
+        self.sp = spotipy.Spotify(auth_manager=auth_manager, requests_session=_build_session())
+        self._cache_ttl_secs = cache_ttl_secs
+        self._cache_max_entries = cache_max_entries
+        # key -> (fetched_at, limit, response)
+        self._search_cache: OrderedDict[str | tuple[str, ...], tuple[float, int, dict]] = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        self._cache_lookups = 0
+        self._cache_hits = 0
         logger.info("Spotify client initialized")
 
+    def warm_up(self) -> bool:
+        """Fetch the client-credentials token eagerly so the first lookup skips it."""
+        try:
+            self.sp.auth_manager.get_access_token(as_dict=False)
+            return True
+        except Exception:
+            logger.warning("Spotify token warm-up failed", exc_info=True)
+            return False
+
+    def _search_raw(self, query: str, limit: int) -> dict:
+        """
+        Run a track search, serving repeated queries from an LRU/TTL cache.
+
+        Each response is stored under two keys: the whitespace- and
+        case-normalized query, and a fuzzy key (see ``_fuzzy_query_key``)
+        so reordered or re-punctuated variants of a query also hit.  Entries
+        remember the limit they were fetched with, and a request for fewer
+        tracks is answered by slicing a larger cached response.
+        """
+        keys: list[str | tuple[str, ...]] = [" ".join(query.lower().split())]
+        fuzzy = _fuzzy_query_key(query)
+        if fuzzy:
+            keys.append(fuzzy)
+
+        now = time.monotonic()
+        with self._search_cache_lock:
+            self._cache_lookups += 1
+            for key in keys:
+                cached = self._search_cache.get(key)
+                if cached is not None and now - cached[0] < self._cache_ttl_secs and cached[1] >= limit:
+                    self._search_cache.move_to_end(key)
+                    self._cache_hits += 1
+                    self._log_cache_stats()
+                    return _slice_tracks(cached[2], limit)
+            self._log_cache_stats()
+
+        results = self.sp.search(q=query, type="track", limit=limit)
+
+        with self._search_cache_lock:
+            for key in keys:
+                cached = self._search_cache.get(key)
+                if cached is not None and now - cached[0] < self._cache_ttl_secs and cached[1] > limit:
+                    continue  # keep the larger response
+                self._search_cache[key] = (now, limit, results)
+                self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self._cache_max_entries:
+                self._search_cache.popitem(last=False)
+        return results
+
+    def _log_cache_stats(self) -> None:
+        if self._cache_lookups % _SEARCH_CACHE_STATS_EVERY == 0:
+            logger.info(
+                "Spotify search cache: %d/%d hits (%.0f%%)",
+                self._cache_hits,
+                self._cache_lookups,
+                100 * self._cache_hits / self._cache_lookups,
+            )
+
     def search(self, query: str) -> TrackInfo | None:
         """
         Search Spotify for a track and return metadata.
@@ -65,7 +242,7 @@ class SpotifyResolver:
             TrackInfo with resolved metadata, or None if not found.
         """
         try:
-            results = self.sp.search(q=query, type="track", limit=1)
+            results = self._search_raw(query, 1)
             tracks = results.get("tracks", {}).get("items", [])
 
             if not tracks:
@@ -108,7 +285,7 @@ class SpotifyResolver:
             List of TrackInfo objects.
         """
         try:
-            results = self.sp.search(q=query, type="track", limit=limit)
+            results = self._search_raw(query, limit)
             tracks = results.get("tracks", {}).get("items", [])
 
             return [
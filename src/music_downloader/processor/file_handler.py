@@ -8,15 +8,162 @@ import logging
 import os
 import re
 import shutil
+import threading
+from collections import deque
 from difflib import SequenceMatcher
 
 import mutagen.flac
 
+try:
+    from watchdog.observers import Observer
+
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+
 logger = logging.getLogger(__name__)
 
 # Audio extensions to check for duplicates
 _AUDIO_EXTENSIONS = {".flac", ".alac", ".wav", ".aiff", ".mp3", ".aac", ".m4a", ".ogg", ".opus", ".wma"}
 
+# Filename patterns
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\w+")
+
+
+def _sequence_ratio(a: str, b: str, cutoff: float) -> float:
+    """
+    Similarity of two strings in 0.0-1.0, or 0.0 if it is below ``cutoff``.
+
+    Checks difflib's cheap upper bounds first and skips the full
+    Ratcliff/Obershelp match when they already rule the pair out.
+    """
+    if a == b:
+        return 1.0
+    matcher = SequenceMatcher(None, a, b)
+    if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= cutoff else 0.0
+
+
+def _iter_file_entries(root: str):
+    """
+    Yield a ``DirEntry`` for every file under ``root``, breadth first.
+
+    Uses ``os.scandir`` so file/dir checks come from the cached directory
+    entry instead of an extra stat per file.
+    """
+    pending = deque([root])
+    while pending:
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
+
+def _find_by_name(root: str, target: str) -> str | None:
+    """Return the first file named ``target`` under ``root``, or None."""
+    return next((entry.path for entry in _iter_file_entries(root) if entry.name == target), None)
+
+
+class _FileIndex:
+    """
+    Basename -> paths index of the download directory.
+
+    Seeded once with a scandir walk on a background thread, then kept
+    current by a watchdog observer so lookups don't have to walk the tree.
+    The observer calls ``dispatch`` from its own thread, so the dict is
+    guarded by a lock.  Several paths can share a basename (one per
+    Soulseek user).  Until seeding finishes ``ready`` is clear and callers
+    fall back to walking the directory themselves.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._paths: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+        self._observer = None
+        self.ready = threading.Event()
+
+    def seed(self) -> None:
+        """Populate the index from the current contents of ``root``."""
+        for entry in _iter_file_entries(self.root):
+            self.add(entry.path)
+        self.ready.set()
+
+    def start(self) -> bool:
+        """Start watching ``root`` and seed the index in the background.  Returns False if unavailable."""
+        if not HAS_WATCHDOG:
+            return False
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(self, self.root, recursive=True)
+            observer.start()
+        except Exception:
+            logger.warning("Download index watcher failed to start", exc_info=True)
+            return False
+        self._observer = observer
+        # The observer is already running, so files created during the walk
+        # are caught either way (add() ignores duplicates)
+        threading.Thread(target=self.seed, name="download-index-seed", daemon=True).start()
+        logger.info(f"Watching download directory: {self.root}")
+        return True
+
+    def stop(self) -> None:
+        """Stop the observer and wait for its thread to exit."""
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join()
+
+    def add(self, path: str) -> None:
+        with self._lock:
+            paths = self._paths.setdefault(os.path.basename(path), [])
+            if path not in paths:
+                paths.append(path)
+
+    def discard(self, path: str) -> None:
+        name = os.path.basename(path)
+        with self._lock:
+            paths = self._paths.get(name)
+            if paths and path in paths:
+                paths.remove(path)
+                if not paths:
+                    del self._paths[name]
+
+    def dispatch(self, event) -> None:
+        """Watchdog event callback."""
+        if event.is_directory:
+            # Files under a moved/deleted directory are dropped lazily by lookup()
+            return
+        if event.event_type in ("created", "closed"):
+            self.add(os.fsdecode(event.src_path))
+        elif event.event_type == "deleted":
+            self.discard(os.fsdecode(event.src_path))
+        elif event.event_type == "moved":
+            self.discard(os.fsdecode(event.src_path))
+            self.add(os.fsdecode(event.dest_path))
+
+    def lookup(self, basename: str, directory: str) -> str | None:
+        """Return an existing path for ``basename`` somewhere under ``directory``, or None."""
+        prefix = os.path.join(directory, "")
+        with self._lock:
+            candidates = [p for p in self._paths.get(basename, ()) if p.startswith(prefix)]
+        for path in candidates:
+            if os.path.isfile(path):
+                return path
+            self.discard(path)
+        return None
+
 
 class FileProcessor:
     """Handles file renaming, moving, and cleanup."""
@@ -28,8 +175,22 @@ class FileProcessor:
 
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
+
+        # Live index of the download directory (needs the optional watchdog package)
+        self._index: _FileIndex | None = None
+        if HAS_WATCHDOG and os.path.isdir(download_dir):
+            index = _FileIndex(download_dir)
+            if index.start():
+                self._index = index
+
         logger.info(f"File processor initialized: downloads={download_dir}, output={output_dir}")
 
+    def close(self) -> None:
+        """Stop watching the download directory."""
+        if self._index is not None:
+            self._index.stop()
+            self._index = None
+
     def find_similar(self, query: str, threshold: float = 0.6) -> list[str]:
         """
         Find files in the output directory with names similar to the query.
@@ -47,16 +208,20 @@ class FileProcessor:
 
         query_lower = query.lower()
         # Extract individual words for word-level matching
-        query_words = set(re.findall(r"\w+", query_lower))
+        query_words = set(_WORD_RE.findall(query_lower))
 
         matches = []
-        for filename in os.listdir(self.output_dir):
-            _, ext = os.path.splitext(filename)
-            if ext.lower() not in _AUDIO_EXTENSIONS:
-                continue
-
-            stem = os.path.splitext(filename)[0].lower()
-            stem_words = set(re.findall(r"\w+", stem))
+        with os.scandir(self.output_dir) as entries:
+            audio_files = [
+                (entry.name, stem)
+                for entry in entries
+                for stem, ext in [os.path.splitext(entry.name)]
+                if ext.lower() in _AUDIO_EXTENSIONS and entry.is_file()
+            ]
+
+        for filename, stem in audio_files:
+            stem = stem.lower()
+            stem_words = set(_WORD_RE.findall(stem))
 
             # Word overlap ratio
             if query_words and stem_words:
@@ -65,8 +230,9 @@ class FileProcessor:
             else:
                 word_ratio = 0.0
 
-            # Sequence similarity
-            seq_ratio = SequenceMatcher(None, query_lower, stem).ratio()
+            # Sequence similarity only matters if it can beat both the
+            # threshold and the word overlap
+            seq_ratio = _sequence_ratio(query_lower, stem, max(word_ratio, threshold))
 
             # Use the best of both approaches
             best_ratio = max(word_ratio, seq_ratio)
@@ -109,7 +275,6 @@ class FileProcessor:
         # The basename of the remote file
         basename = remote_filename.rsplit("\\", 1)[-1] if "\\" in remote_filename else remote_filename
 
-        # Walk the download directory looking for the file
         user_dir = os.path.join(self.download_dir, username)
 
         # PATH TRAVERSAL GUARD
@@ -119,24 +284,34 @@ class FileProcessor:
             logger.warning("Path traversal blocked for username: %s", username)
             return None
 
-        if os.path.isdir(user_dir):
-            for root, _, files in os.walk(user_dir):
-                if basename in files:
-                    path = os.path.join(root, basename)
-                    logger.info(f"Found downloaded file: {path}")
-                    return path
+        # slskd usually places the file directly under the user folder.  The
+        # peer-supplied name must be a plain name here, or "../" would escape it.
+        direct = os.path.join(user_dir, basename)
+        if "/" not in basename and os.sep not in basename and basename != ".." and os.path.isfile(direct):
+            logger.info(f"Found downloaded file: {direct}")
+            return direct
+
+        index = self._index
+        if index is not None and index.ready.is_set():
+            path = index.lookup(basename, user_dir)
+        elif os.path.isdir(user_dir):
+            path = _find_by_name(user_dir, basename)
+        else:
+            path = None
+        if path:
+            logger.info(f"Found downloaded file: {path}")
+            return path
 
         # Fallback: search entire download directory
-        for root, _, files in os.walk(self.download_dir):
-            if basename in files:
-                path = os.path.join(root, basename)
-                logger.info(f"Found downloaded file (fallback): {path}")
-                return path
+        path = _find_by_name(self.download_dir, basename)
+        if path:
+            logger.info(f"Found downloaded file (fallback): {path}")
+            return path
 
         logger.warning(f"Downloaded file not found: {basename} (user={username})")
         return None
 
-    def process_file(self, source_path: str, artist: str, title: str) -> str | None:
+    def process_file(self, source_path: str, artist: str, title: str, *, move: bool = False) -> str | None:
         """
         Rename and move a downloaded file to the output directory.
 
@@ -144,6 +319,10 @@ class FileProcessor:
             source_path: Path to the downloaded file.
             artist: Artist name for the filename.
             title: Song title for the filename.
+            move: The source is not needed afterwards.  When it lives on the
+                same filesystem as the output directory it is renamed into
+                place instead of copied (and its emptied parent directory is
+                removed), which makes a later ``cleanup_download`` a no-op.
 
         Returns:
             Path to the final file in the output directory, or None on failure.
@@ -164,25 +343,49 @@ class FileProcessor:
             # Avoid overwriting existing files
             if os.path.exists(target_path):
                 logger.warning(f"File already exists: {target_path}")
-                # Add a numeric suffix
-                base, ext_with_dot = os.path.splitext(target_path)
+                # Add the first free numeric suffix (one directory read, not a stat per candidate)
+                with os.scandir(self.output_dir) as it:
+                    existing = {entry.name for entry in it}
+                base, ext_with_dot = os.path.splitext(target_name)
                 counter = 1
-                while os.path.exists(target_path):
-                    target_path = f"{base} ({counter}){ext_with_dot}"
+                while f"{base} ({counter}){ext_with_dot}" in existing:
                     counter += 1
+                target_path = os.path.join(self.output_dir, f"{base} ({counter}){ext_with_dot}")
 
             # Copy to a temp file with a non-audio extension so downstream
             # watchers (audio-transcoder, Navidrome) ignore it entirely.
             # Clean tags on the temp file, then atomically rename into place.
             tmp_path = target_path + ".importing"
-            try:
-                shutil.copy2(source_path, tmp_path)
-                self._dedup_flac_tags(tmp_path)
-                os.replace(tmp_path, target_path)
-            except BaseException:
+            renamed = False
+            if move and os.stat(source_path).st_dev == os.stat(self.output_dir).st_dev:
+                # Same filesystem: a rename is O(1) regardless of file size.
+                # Separate bind mounts (EXDEV) or a read-only source (EROFS)
+                # still refuse it, so fall back to copying.
+                try:
+                    os.replace(source_path, tmp_path)
+                    renamed = True
+                except OSError as e:
+                    logger.debug(f"Rename failed, copying instead: {source_path} ({e})")
+            if renamed:
+                try:
+                    self._dedup_flac_tags(tmp_path)
+                    os.replace(tmp_path, target_path)
+                except BaseException:
+                    with contextlib.suppress(OSError):
+                        os.replace(tmp_path, source_path)
+                    raise
+                # The file is already placed; pruning its old folder is best effort
                 with contextlib.suppress(OSError):
-                    os.remove(tmp_path)
-                raise
+                    self._remove_empty_parent(source_path)
+            else:
+                try:
+                    shutil.copy2(source_path, tmp_path)
+                    self._dedup_flac_tags(tmp_path)
+                    os.replace(tmp_path, target_path)
+                except BaseException:
+                    with contextlib.suppress(OSError):
+                        os.remove(tmp_path)
+                    raise
             logger.info(f"File placed: {target_path}")
 
             return target_path
@@ -207,10 +410,7 @@ class FileProcessor:
                 logger.info(f"Cleaned up: {source_path}")
 
                 # Also remove the parent directory if empty
-                parent = os.path.dirname(source_path)
-                if os.path.isdir(parent) and not os.listdir(parent):
-                    os.rmdir(parent)
-                    logger.debug(f"Removed empty directory: {parent}")
+                self._remove_empty_parent(source_path)
 
                 return True
             return False
@@ -219,6 +419,22 @@ class FileProcessor:
             logger.exception(f"Failed to cleanup: {source_path}")
             return False
 
+    @staticmethod
+    def _remove_empty_parent(path: str) -> None:
+        """Remove the directory containing ``path`` if it is now empty."""
+        parent = os.path.dirname(path)
+        # Stop at the first entry instead of listing the whole directory.
+        # Another download may land in (or remove) the folder at any time,
+        # so a failed check or rmdir just leaves it alone.
+        try:
+            with os.scandir(parent) as it:
+                if next(it, None) is not None:
+                    return
+            os.rmdir(parent)
+        except OSError:
+            return
+        logger.debug(f"Removed empty directory: {parent}")
+
     @staticmethod
     def _dedup_flac_tags(filepath: str) -> None:
         """Remove exact duplicate Vorbis comment values in a FLAC file.
@@ -262,9 +478,9 @@ class FileProcessor:
             Sanitized filename safe for all major filesystems.
         """
         # Replace characters invalid on Windows/Linux/macOS
-        name = re.sub(r'[<>:"/\\|?*]', "", name)
+        name = _INVALID_CHARS_RE.sub("", name)
         # Replace multiple spaces with single space
-        name = re.sub(r"\s+", " ", name)
+        name = _WHITESPACE_RE.sub(" ", name)
         # Strip leading/trailing whitespace and dots
         name = name.strip(" .")
         return name
@@ -15,10 +15,13 @@ Verdicts:
 """
 
 import contextlib
+import functools
 import logging
 import os
 import re
 import tempfile
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 
 try:
@@ -65,12 +68,80 @@ class FlacVerdict:
         return f"{self.emoji} {label} (cutoff {self.cutoff_khz:.1f}kHz)"
 
 
+# libsndfile subtype -> bit depth; anything else falls back to the digits in the name
+_SUBTYPE_BITS = {
+    "PCM_S8": 8,
+    "PCM_U8": 8,
+    "PCM_16": 16,
+    "PCM_24": 24,
+    "PCM_32": 32,
+    "FLOAT": 32,
+    "DOUBLE": 64,
+}
+_BITS_RE = re.compile(r"\d+")
+
+
+def _bit_depth(subtype: str | None) -> int:
+    """Bit depth for a soundfile subtype (e.g. "PCM_16" -> 16), 0 if unknown."""
+    bits = _SUBTYPE_BITS.get(subtype or "")
+    if bits is not None:
+        return bits
+    match = _BITS_RE.search(subtype or "")
+    return int(match.group()) if match else 0
+
+
+# Welch segment length and how many segments' worth of audio to decode
+_WELCH_NPERSEG = 8192
+_WELCH_TARGET_SEGMENTS = 40
+
+
+@functools.lru_cache(maxsize=4)
+def _hann(n: int) -> "np.ndarray":
+    """Periodic Hann window of length ``n``, built once per size."""
+    window = signal.windows.hann(n, sym=False).astype(np.float32)
+    window.flags.writeable = False
+    return window
+
+
+# Memoized verdicts keyed by (abspath, size, mtime_ns, sample_duration), LRU-evicted
+_VERDICT_CACHE_MAX_ENTRIES = 4096
+_verdict_cache: OrderedDict[tuple, FlacVerdict] = OrderedDict()
+_verdict_cache_lock = threading.Lock()
+
+# A cutoff counts only when this many adjacent bins sit below the threshold
+_SUSTAINED_DROP_BINS = 4
+
+
+def _find_sustained_drop(freqs: "np.ndarray", psd_db: "np.ndarray", threshold: float) -> float | None:
+    """
+    Return the frequency where the first sustained drop below ``threshold`` starts.
+
+    A drop is sustained when ``_SUSTAINED_DROP_BINS`` consecutive bins are all
+    below the threshold; a sliding sum over the boolean mask finds the first
+    such run in one vectorized pass.
+
+    Returns:
+        Start frequency of the first run, or None if there is none.
+    """
+    if len(psd_db) < _SUSTAINED_DROP_BINS:
+        return None
+    below = (psd_db < threshold).astype(np.uint8)
+    runs = np.convolve(below, np.ones(_SUSTAINED_DROP_BINS, dtype=np.uint8), mode="valid") == _SUSTAINED_DROP_BINS
+    if not runs.any():
+        return None
+    return float(freqs[np.argmax(runs)])
+
+
 def analyze_flac(filepath: str, sample_duration: float = 30.0) -> FlacVerdict | None:
     """
     Analyze a FLAC file for losslessness via spectral cutoff detection.
 
-    Reads a 30-second segment from the middle of the file, computes the
-    power spectral density, and looks for a sharp energy drop above 14 kHz.
+    Reads a segment from the middle of the file (up to ``sample_duration``
+    seconds, capped at what the Welch average needs), computes the power
+    spectral density, and looks for a sharp energy drop above 14 kHz.
+
+    Verdicts are memoized by (path, size, mtime), so re-checking an
+    unchanged file is a dict lookup.
 
     Args:
         filepath: Path to a FLAC file on disk.
@@ -82,28 +153,78 @@ def analyze_flac(filepath: str, sample_duration: float = 30.0) -> FlacVerdict |
     if not HAS_ANALYSIS:
         return None
 
+    key = _verdict_cache_key(filepath, sample_duration)
+    if key is None:
+        return None
+    cached = _verdict_cache_get(key)
+    if cached is not None:
+        return cached
+
+    verdict = _analyze(filepath, sample_duration)
+    _verdict_cache_put(key, verdict)
+    return verdict
+
+
+def _verdict_cache_key(filepath: str, sample_duration: float) -> tuple | None:
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        logger.exception("Failed to analyze FLAC: %s", filepath)
+        return None
+    return (os.path.abspath(filepath), st.st_size, st.st_mtime_ns, sample_duration)
+
+
+def _verdict_cache_get(key: tuple) -> FlacVerdict | None:
+    with _verdict_cache_lock:
+        cached = _verdict_cache.get(key)
+        if cached is not None:
+            _verdict_cache.move_to_end(key)
+        return cached
+
+
+def _verdict_cache_put(key: tuple, verdict: FlacVerdict | None) -> None:
+    if verdict is None:
+        return
+    with _verdict_cache_lock:
+        _verdict_cache[key] = verdict
+        while len(_verdict_cache) > _VERDICT_CACHE_MAX_ENTRIES:
+            _verdict_cache.popitem(last=False)
+
+
+def _analyze(filepath: str, sample_duration: float) -> FlacVerdict | None:
+    """Uncached body of :func:`analyze_flac`."""
     try:
         info = sf.info(filepath)
         sr = info.samplerate
         nyquist = sr / 2
 
-        # Parse bit depth from subtype (e.g. "PCM_16" -> 16, "PCM_24" -> 24)
-        bit_match = re.search(r"\d+", info.subtype or "")
-        bit_depth = int(bit_match.group()) if bit_match else 0
+        bit_depth = _bit_depth(info.subtype)
 
-        # Read a segment from the middle of the file (avoids silence at start/end)
+        # Read a segment from the middle of the file (avoids silence at start/end).
+        # Only as many frames as the Welch average needs are decoded.
         total_frames = info.frames
         start_frame = max(0, total_frames // 3)
-        frames_to_read = min(int(sr * sample_duration), total_frames - start_frame)
+        frames_to_read = min(
+            _WELCH_NPERSEG * _WELCH_TARGET_SEGMENTS,
+            int(sr * sample_duration),
+            total_frames - start_frame,
+        )
 
-        data, _ = sf.read(filepath, start=start_frame, frames=frames_to_read, dtype="float32")
+        buf = np.empty((frames_to_read, info.channels), dtype=np.float32)
+        frames, _ = sf.read(filepath, start=start_frame, out=buf)
 
-        # If stereo, average channels
-        if data.ndim > 1:
-            data = data.mean(axis=1)
+        # Mix down to mono
+        if info.channels == 1:
+            data = frames[:, 0]
+        elif info.channels == 2:
+            data = np.add(frames[:, 0], frames[:, 1])
+            np.multiply(data, 0.5, out=data)
+        else:
+            data = frames.mean(axis=1, dtype=np.float32)
 
         # Skip near-silent files
-        rms = np.sqrt(np.mean(data**2))
+        # Sum of squares as one dot product (no squared temporary)
+        rms = float(np.sqrt(np.dot(data, data) / data.size)) if data.size else 0.0
         if rms < 0.001:
             return FlacVerdict(
                 verdict="AUTHENTIC",
@@ -114,16 +235,25 @@ def analyze_flac(filepath: str, sample_duration: float = 30.0) -> FlacVerdict |
             )
 
         # Compute power spectral density using Welch's method
-        nperseg = min(8192, len(data))
-        freqs, psd = signal.welch(data, fs=sr, nperseg=nperseg, noverlap=nperseg // 2)
+        nperseg = min(_WELCH_NPERSEG, len(data))
+        # Detrending is skipped: only relative levels between bands matter.
+        freqs, psd = signal.welch(
+            data,
+            fs=sr,
+            window=_hann(nperseg),
+            nperseg=nperseg,
+            noverlap=nperseg // 2,
+            detrend=False,
+        )
 
         # Convert to dB
         psd_db = 10 * np.log10(psd + 1e-30)
 
         # Analyze high-frequency region (above 14 kHz)
-        high_freq_mask = freqs >= 14000
-        high_freqs = freqs[high_freq_mask]
-        high_psd = psd_db[high_freq_mask]
+        # freqs is sorted, so each band is a contiguous slice (a view, no mask)
+        high_start = np.searchsorted(freqs, 14000, side="left")
+        high_freqs = freqs[high_start:]
+        high_psd = psd_db[high_start:]
 
         if len(high_freqs) < 10:
             return FlacVerdict(
@@ -135,25 +265,15 @@ def analyze_flac(filepath: str, sample_duration: float = 30.0) -> FlacVerdict |
             )
 
         # Reference level: average energy in the mid-frequency band (2-8 kHz)
-        mid_mask = (freqs >= 2000) & (freqs <= 8000)
-        mid_energy = np.mean(psd_db[mid_mask]) if np.any(mid_mask) else -60
+        mid_start = np.searchsorted(freqs, 2000, side="left")
+        mid_end = np.searchsorted(freqs, 8000, side="right")
+        mid_energy = psd_db[mid_start:mid_end].mean() if mid_end > mid_start else -60
 
         # Find where high-frequency energy drops more than 30dB below mid-band
         threshold = mid_energy - 30
-        cutoff_idx = np.where(high_psd < threshold)[0]
-
-        cutoff_freq = float(nyquist)
-        if len(cutoff_idx) > 0:
-            # Find the first sustained drop (at least 3 consecutive bins below threshold)
-            consecutive = 0
-            for i in range(len(cutoff_idx) - 1):
-                if cutoff_idx[i + 1] - cutoff_idx[i] == 1:
-                    consecutive += 1
-                    if consecutive >= 3:
-                        cutoff_freq = float(high_freqs[cutoff_idx[i - 2]])
-                        break
-                else:
-                    consecutive = 0
+        cutoff_freq = _find_sustained_drop(high_freqs, high_psd, threshold)
+        if cutoff_freq is None:
+            cutoff_freq = float(nyquist)
 
         cutoff_khz = cutoff_freq / 1000
         nyquist_khz = nyquist / 1000
@@ -4,11 +4,18 @@ Scores results based on duration match, audio quality, source reliability,
 and filename analysis to filter out unwanted versions.
 """
 
+from __future__ import annotations
+
+import functools
 import logging
 import re
+from typing import TYPE_CHECKING, NamedTuple
 
-from music_downloader.metadata.spotify import TrackInfo
-from music_downloader.search.slskd_client import SearchResult
+if TYPE_CHECKING:
+    # Annotation-only: importing the scorer should not pull in spotipy or
+    # the slskd HTTP client.
+    from music_downloader.metadata.spotify import TrackInfo
+    from music_downloader.search.slskd_client import SearchResult
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +31,30 @@ SLOT_AVAILABLE_POINTS = 7.5
 SPEED_MAX_POINTS = 7.5
 QUEUE_MAX_POINTS = 5.0
 
+_WORD_RE = re.compile(r"\w+")
+
+# The same results are rescored against the same track (fallback passes
+# with a wider duration window, page re-renders), so the text-derived terms
+# are memoized.  Sized to hold a few full slskd result sets.
+_FILENAME_WORDS_CACHE_MAX_ENTRIES = 8192
+_TRACK_TERMS_CACHE_MAX_ENTRIES = 64
+
+
+@functools.lru_cache(maxsize=_FILENAME_WORDS_CACHE_MAX_ENTRIES)
+def _filename_words(filename: str) -> frozenset[str]:
+    """Lower-cased word set of a remote path, used for relevance matching."""
+    return frozenset(_WORD_RE.findall(filename.lower()))
+
+
+class _TrackTerms(NamedTuple):
+    """Values derived from the reference track, computed once per scoring run."""
+
+    artist_words: set[str]
+    title_words: set[str]
+    duration_secs: int
+    # Matches any exclude keyword the title itself doesn't contain (None: nothing to exclude)
+    exclude_re: re.Pattern[str] | None
+
 
 class ResultScorer:
     """Scores and ranks slskd search results against a Spotify track."""
@@ -45,6 +76,42 @@ class ResultScorer:
             "radio edit",
             "tribute",
         ]
+        # One combined pattern checks every keyword in a single C-level scan
+        # instead of K substring tests per result.
+        self._exclude_re = self._compile_keywords(self.exclude_keywords)
+        self._terms_cache: dict[TrackInfo, _TrackTerms] = {}
+
+    @staticmethod
+    def _compile_keywords(keywords: list[str]) -> re.Pattern[str] | None:
+        # Keywords must start a word ("live" must not hit "Oliver", "cover"
+        # not "Discover") but may run on into it ("remaster" -> "Remastered").
+        # "_" counts as a separator, as in "bang_bang_remix.flac".
+        if not keywords:
+            return None
+        alternatives = (rf"(?<![^\W_]){re.escape(kw)}" if _WORD_RE.match(kw) else re.escape(kw) for kw in keywords)
+        return re.compile("|".join(alternatives))
+
+    def _track_terms(self, track: TrackInfo) -> _TrackTerms:
+        """Derive the per-track values used for every result (memoized per track)."""
+        terms = self._terms_cache.get(track)
+        if terms is None:
+            if len(self._terms_cache) >= _TRACK_TERMS_CACHE_MAX_ENTRIES:
+                self._terms_cache.clear()
+            terms = self._terms_cache[track] = self._build_track_terms(track)
+        return terms
+
+    def _build_track_terms(self, track: TrackInfo) -> _TrackTerms:
+        title_lower = track.title.lower()
+        # Keywords in the title itself ("... (Live)") are allowed; the rest
+        # become one pattern, reusing the prebuilt one in the common case.
+        active = [kw for kw in self.exclude_keywords if kw.lower() not in title_lower]
+        exclude_re = self._exclude_re if len(active) == len(self.exclude_keywords) else self._compile_keywords(active)
+        return _TrackTerms(
+            artist_words=set(_WORD_RE.findall(track.artist.lower())),
+            title_words=set(_WORD_RE.findall(title_lower)),
+            duration_secs=track.duration_secs,
+            exclude_re=exclude_re,
+        )
 
     def score_results(
         self,
@@ -68,52 +135,49 @@ class ResultScorer:
         Returns:
             Filtered and sorted list of SearchResult with scores assigned.
         """
-        scored = []
-
-        for result in results:
-            score = self._calculate_score(result, track, max_duration_diff)
-            if score is not None:
-                result.score = score
-                scored.append(result)
-
-        # Sort by score descending
-        scored.sort(key=lambda r: r.score, reverse=True)
-
-        # Deduplicate by basename (keep highest score)
-        seen_basenames = set()
-        deduplicated = []
-        for result in scored:
+        # Track-derived terms are the same for every result
+        terms = self._track_terms(track)
+
+        # Score and deduplicate by basename in one pass (keep highest score,
+        # earliest result on a tie).  Each survivor keeps its input position.
+        best: dict[str, tuple[int, SearchResult]] = {}
+        scored_count = 0
+        for position, result in enumerate(results):
+            score = self._calculate_score(result, terms, max_duration_diff)
+            if score is None:
+                continue
+            result.score = score
+            scored_count += 1
             basename_key = result.basename.lower()
-            if basename_key not in seen_basenames:
-                seen_basenames.add(basename_key)
-                deduplicated.append(result)
+            prev = best.get(basename_key)
+            if prev is None or prev[1].score < score:
+                best[basename_key] = (position, result)
 
-        logger.info(f"Scored {len(scored)} results, {len(deduplicated)} after dedup (from {len(results)} total)")
+        # Sort by score descending; equal scores stay in input order
+        ranked = sorted(best.values(), key=lambda entry: (-entry[1].score, entry[0]))
+        deduplicated = [result for _, result in ranked]
+
+        logger.info(f"Scored {scored_count} results, {len(deduplicated)} after dedup (from {len(results)} total)")
         return deduplicated
 
     def _calculate_score(
-        self, result: SearchResult, track: TrackInfo, max_duration_diff: int | None = None
+        self,
+        result: SearchResult,
+        terms: _TrackTerms,
+        max_duration_diff: int | None = None,
     ) -> float | None:
         """
-        Calculate a score for a single result.
+        Calculate a score for a single result against the reference track's
+        precomputed ``terms``.
 
         Returns:
             Score (0-100), or None if the result should be excluded.
         """
         score = 0.0
 
-        # ===== EXCLUDE FILTER =====
-        filename_lower = result.filename.lower()
-        basename_lower = result.basename.lower()
-
-        for keyword in self.exclude_keywords:
-            if keyword in basename_lower:
-                if keyword.lower() not in track.title.lower():
-                    logger.debug(f"Excluded (keyword '{keyword}'): {result.basename}")
-                    return None
-
         # ===== DURATION MATCH (0-40 points) =====
-        target_secs = track.duration_secs
+        # Integer comparisons first: the cheapest way to drop a result
+        target_secs = terms.duration_secs
         if target_secs == 0:
             score += DURATION_FLAT_POINTS
         elif result.length is not None and result.length > 0:
@@ -128,11 +192,18 @@ class ResultScorer:
             elif max_duration_diff is not None and diff <= max_duration_diff:
                 pass  # 0 duration points — different version, still acceptable
             else:
-                logger.debug(f"Excluded (duration {result.length}s vs {target_secs}s): {result.basename}")
+                logger.debug("Excluded (duration %ss vs %ss): %s", result.length, target_secs, result.basename)
                 return None
         else:
             score += DURATION_FLAT_POINTS
 
+        # ===== EXCLUDE FILTER =====
+        if terms.exclude_re is not None:
+            match = terms.exclude_re.search(result.basename.lower())
+            if match:
+                logger.debug("Excluded (keyword '%s'): %s", match.group(), result.basename)
+                return None
+
         # ===== AUDIO QUALITY (0-25 points) =====
         # Prefer hi-res: higher bit depth and sample rate score better
         if result.bit_depth:
@@ -169,16 +240,11 @@ class ResultScorer:
 
         # ===== FILENAME RELEVANCE (0-15 points) =====
         # Boost results that contain the artist and title in the filename
-        artist_lower = track.artist.lower()
-        title_lower = track.title.lower()
-
-        # Simple word matching
-        artist_words = set(re.findall(r"\w+", artist_lower))
-        title_words = set(re.findall(r"\w+", title_lower))
-        filename_words = set(re.findall(r"\w+", filename_lower))
+        # (simple word matching)
+        filename_words = _filename_words(result.filename)
 
-        artist_match = len(artist_words & filename_words) / max(len(artist_words), 1)
-        title_match = len(title_words & filename_words) / max(len(title_words), 1)
+        artist_match = len(terms.artist_words & filename_words) / max(len(terms.artist_words), 1)
+        title_match = len(terms.title_words & filename_words) / max(len(terms.title_words), 1)
 
         score += artist_match * SPEED_MAX_POINTS
         score += title_match * SPEED_MAX_POINTS
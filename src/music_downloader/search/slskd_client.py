@@ -3,22 +3,87 @@ slskd API client for searching and downloading files from Soulseek.
 """
 
 import asyncio
+import concurrent.futures
 import contextlib
+import functools
 import logging
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 
 import requests.exceptions
 import slskd_api
+from slskd_api.client import HTTPAdapterTimeout
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Polling: start fast so quick completions are noticed quickly, then back off
+# geometrically up to the old fixed interval so long waits don't cost more polls.
+_POLL_INITIAL_SECS = 0.25
+_POLL_BACKOFF = 1.5
+_SEARCH_POLL_MAX_SECS = 2.0
+_DOWNLOAD_POLL_MAX_SECS = 3.0
+
+# Parsed responses are kept briefly so the FLAC pass and the all-audio
+# fallback over the same response list share one walk.
+_PARSE_CACHE_MAX_ENTRIES = 4
+_PARSE_CACHE_TTL_SECS = 60.0
+
+# Blocking slskd HTTP calls run on a small dedicated pool rather than the
+# loop's default executor, which other work (FLAC analysis, file I/O) shares.
+_EXECUTOR_MAX_WORKERS = 4
+
+# slskd-api shares one requests.Session across its endpoint groups; give it a
+# pool as wide as our executor, a request timeout so a hung slskd can't pin
+# executor threads forever, and retries for idempotent calls on dropped
+# keep-alive connections.
+_HTTP_TIMEOUT_SECS = 60.0
+_HTTP_RETRIES = Retry(total=2, backoff_factor=0.2, allowed_methods=frozenset({"GET", "DELETE"}))
+
+# Read-only listings fetched twice within this window share one request
+_RESPONSE_CACHE_TTL_SECS = 1.0
+_RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# How long searches fail fast after slskd was found unreachable
+_UNAVAILABLE_RETRY_SECS = 5.0
+
+# Stale-search cleanup runs at most once per interval, and only deletes once
+# enough searches have piled up to trigger slskd's empty-responses bug.
+_CLEANUP_INTERVAL_SECS = 60.0
+_CLEANUP_STALE_THRESHOLD = 5
+# Searches younger than this may still belong to a concurrent search of ours
+_CLEANUP_MIN_AGE_SECS = 300.0
+
+
+_COMPLETE_STATES = frozenset({"completed", "succeeded"})
+_FAILED_STATES = frozenset({"errored", "rejected", "timedout", "cancelled"})
+
+
+def _search_timestamp(search: dict) -> float:
+    """
+    When a stored search last changed (``endedAt``, else ``startedAt``), as a
+    UTC epoch; ``-inf`` when unknown, so unparseable entries count as stale.
+    """
+    stamp = search.get("endedAt") or search.get("startedAt")
+    if not stamp:
+        return float("-inf")
+    try:
+        parsed = datetime.fromisoformat(stamp)
+    except (TypeError, ValueError):
+        return float("-inf")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)  # slskd reports UTC
+    return parsed.timestamp()
+
 
 class SlskdUnavailableError(Exception):
     """Raised when the slskd API is unreachable (network/connection errors)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A single file result from a slskd search."""
 
@@ -33,25 +98,40 @@ class SearchResult:
     upload_speed: int = 0
     queue_length: int = 0
     score: float = 0.0  # Assigned by scorer
+    # Derived strings are read repeatedly while scoring, deduplicating and
+    # rendering; with slots there is no __dict__ for cached_property, so
+    # they are cached here on first access.
+    _basename: str | None = field(default=None, init=False, repr=False, compare=False)
+    _extension: str | None = field(default=None, init=False, repr=False, compare=False)
+    _duration_display: str | None = field(default=None, init=False, repr=False, compare=False)
+    _quality_display: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def basename(self) -> str:
-        """Extract filename from the full remote path."""
-        # slskd paths use backslashes
-        return self.filename.rsplit("\\", 1)[-1] if "\\" in self.filename else self.filename
+        """Extract filename from the full remote path (cached)."""
+        if self._basename is None:
+            # slskd paths use backslashes
+            self._basename = self.filename.rsplit("\\", 1)[-1]
+        return self._basename
 
     @property
     def extension(self) -> str:
-        """File extension in lowercase."""
-        return self.basename.rsplit(".", 1)[-1].lower() if "." in self.basename else ""
+        """File extension in lowercase (cached)."""
+        if self._extension is None:
+            basename = self.basename
+            self._extension = basename.rsplit(".", 1)[-1].lower() if "." in basename else ""
+        return self._extension
 
     @property
     def duration_display(self) -> str:
-        """Human-readable duration."""
-        if not self.length:
-            return "??:??"
-        mins, secs = divmod(self.length, 60)
-        return f"{mins}:{secs:02d}"
+        """Human-readable duration (cached)."""
+        if self._duration_display is None:
+            if not self.length:
+                self._duration_display = "??:??"
+            else:
+                mins, secs = divmod(self.length, 60)
+                self._duration_display = f"{mins}:{secs:02d}"
+        return self._duration_display
 
     @property
     def size_mb(self) -> float:
@@ -60,19 +140,21 @@ class SearchResult:
 
     @property
     def quality_display(self) -> str:
-        """Human-readable quality info."""
-        parts = []
-        if self.bit_depth and self.sample_rate:
-            parts.append(f"{self.bit_depth}bit/{self.sample_rate / 1000:.1f}kHz")
-        if self.bit_rate:
-            parts.append(f"{self.bit_rate}kbps")
-        return ", ".join(parts) if parts else "FLAC"
+        """Human-readable quality info (cached)."""
+        if self._quality_display is None:
+            parts = []
+            if self.bit_depth and self.sample_rate:
+                parts.append(f"{self.bit_depth}bit/{self.sample_rate / 1000:.1f}kHz")
+            if self.bit_rate:
+                parts.append(f"{self.bit_rate}kbps")
+            self._quality_display = ", ".join(parts) if parts else "FLAC"
+        return self._quality_display
 
     def __str__(self) -> str:
         return f"{self.basename} ({self.duration_display}, {self.quality_display}, {self.size_mb:.1f}MB)"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DownloadStatus:
     """Status of a file download."""
 
@@ -83,24 +165,27 @@ class DownloadStatus:
     bytes_transferred: int = 0
     size: int = 0
     average_speed: float = 0.0
+    id: str = ""  # slskd transfer id
+    # slskd returns comma-separated states like "Completed, Succeeded"
+    _state_tokens: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_state_tokens", frozenset(t.strip() for t in self.state.lower().split(",")))
 
     @property
     def is_complete(self) -> bool:
-        # slskd returns comma-separated states like "Completed, Succeeded"
-        state_lower = self.state.lower()
-        return "completed" in state_lower or "succeeded" in state_lower
+        return not self._state_tokens.isdisjoint(_COMPLETE_STATES)
 
     @property
     def is_failed(self) -> bool:
-        state_lower = self.state.lower()
-        return any(kw in state_lower for kw in ("errored", "rejected", "timedout", "cancelled"))
+        return not self._state_tokens.isdisjoint(_FAILED_STATES)
 
     @property
     def is_active(self) -> bool:
         return not self.is_complete and not self.is_failed
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveDownload:
     """Tracks a download request with its context."""
 
@@ -114,8 +199,105 @@ class SlskdClient:
     """Wrapper around slskd-api for search and download operations."""
 
     def __init__(self, host: str, api_key: str):
-        self.client = slskd_api.SlskdClient(host, api_key)
-        logger.info(f"slskd client initialized for {host}")
+        self._host = host
+        self._api_key = api_key
+        self._client: slskd_api.SlskdClient | None = None
+        self._client_lock = threading.Lock()
+        # After a connection failure, searches fail fast until this (monotonic) time
+        self._unavailable_until = 0.0
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_EXECUTOR_MAX_WORKERS, thread_name_prefix="slskd"
+        )
+        # (username, filename) -> futures of wait_for_download callers
+        self._download_watchers: dict[tuple[str, str], list[asyncio.Future]] = {}
+        self._download_poller: asyncio.Task | None = None
+        # id(responses) -> (parsed_at, responses, [(is_flac, result), ...])
+        self._parse_cache: OrderedDict[int, tuple[float, list[dict], list[tuple[bool, SearchResult]]]] = OrderedDict()
+        self._last_cleanup = float("-inf")
+        # (endpoint, *args) -> (fetched_at, value), oldest fetch first.
+        # Filled from executor threads, hence the lock.
+        self._response_cache: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+    @property
+    def client(self) -> slskd_api.SlskdClient:
+        """The slskd-api client, built on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._build_client()
+        return self._client
+
+    @client.setter
+    def client(self, value: slskd_api.SlskdClient) -> None:
+        self._client = value
+
+    def _build_client(self) -> slskd_api.SlskdClient:
+        client = slskd_api.SlskdClient(self._host, self._api_key)
+        adapter = HTTPAdapterTimeout(
+            timeout=_HTTP_TIMEOUT_SECS,
+            pool_connections=1,
+            pool_maxsize=_EXECUTOR_MAX_WORKERS,
+            max_retries=_HTTP_RETRIES,
+        )
+        session = client.application.session
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        logger.info(f"slskd client initialized for {self._host}")
+        return client
+
+    def close(self) -> None:
+        """Shut down the executor; calls still queued on it are not waited for."""
+        self._executor.shutdown(wait=False)
+
+    async def _call(self, fn, /, *args, **kwargs):
+        """Run a blocking slskd call on the client's executor."""
+        if kwargs:
+            fn = functools.partial(fn, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _cached_fetch(self, key: tuple, fn, *args):
+        """Return ``fn(*args)``, reusing a result fetched under ``key`` within the last second."""
+        now = time.monotonic()
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+        if cached is not None and now - cached[0] < _RESPONSE_CACHE_TTL_SECS:
+            return cached[1]
+        # The request itself runs outside the lock
+        value = fn(*args)
+        with self._response_cache_lock:
+            cache = self._response_cache
+            cache[key] = (now, value)
+            cache.move_to_end(key)
+            # Entries are ordered by fetch time, so expired ones sit at the front
+            while cache and (
+                len(cache) > _RESPONSE_CACHE_MAX_ENTRIES
+                or now - next(iter(cache.values()))[0] >= _RESPONSE_CACHE_TTL_SECS
+            ):
+                cache.popitem(last=False)
+        return value
+
+    def _invalidate_responses(self, *keys: tuple) -> None:
+        """Drop cached listings that a state change has made stale."""
+        with self._response_cache_lock:
+            for key in keys:
+                self._response_cache.pop(key, None)
+
+    async def ping(self) -> bool:
+        """
+        Issue a lightweight request to slskd so the HTTP session opens a
+        keep-alive socket before the first real search.
+
+        Returns:
+            True if slskd answered, False otherwise.
+        """
+        try:
+            await self._call(self.client.application.version)
+            logger.debug("slskd connection warmed up")
+            return True
+        except Exception:
+            logger.warning("slskd warm-up ping failed", exc_info=True)
+            return False
 
     async def search(self, query: str, timeout_secs: int = 30, response_limit: int = 500) -> list[dict]:
         """
@@ -132,14 +314,19 @@ class SlskdClient:
 
         Returns:
             List of raw search response dicts from slskd API.
+
+        Raises:
+            SlskdUnavailableError: If slskd is unreachable, or was within
+                the last ``_UNAVAILABLE_RETRY_SECS``.
         """
         search_id: str | None = None
 
+        if time.monotonic() < self._unavailable_until:
+            raise SlskdUnavailableError("slskd API unreachable (failed moments ago)")
+
         try:
-            return await asyncio.wait_for(
-                self._search_inner(query, timeout_secs, response_limit),
-                timeout=timeout_secs + 10,  # hard safety net
-            )
+            async with asyncio.timeout(timeout_secs + 10):  # hard safety net
+                return await self._search_inner(query, timeout_secs, response_limit)
         except TimeoutError:
             logger.warning(f"Hard timeout hit for search: {query}")
             # _search_inner handles its own cleanup, but if the hard
@@ -149,6 +336,7 @@ class SlskdClient:
             return []
         except requests.exceptions.RequestException as exc:
             logger.exception(f"slskd search failed for: {query}")
+            self._unavailable_until = time.monotonic() + _UNAVAILABLE_RETRY_SECS
             raise SlskdUnavailableError(f"slskd API unreachable: {exc}") from exc
         except Exception:
             logger.exception(f"slskd search failed for: {query}")
@@ -161,22 +349,37 @@ class SlskdClient:
         the ``includeResponses`` parameter silently returns empty arrays
         even though ``responseCount`` is > 0.  Clearing them before each
         new search avoids this bug.
+
+        To save round trips, this is skipped if it ran within the last
+        ``_CLEANUP_INTERVAL_SECS``, and nothing is deleted while fewer than
+        ``_CLEANUP_STALE_THRESHOLD`` searches are stored.  Searches that
+        ended (or started) within ``_CLEANUP_MIN_AGE_SECS`` are kept, since
+        they may belong to another search in flight.
         """
+        now = time.monotonic()
+        if now - self._last_cleanup < _CLEANUP_INTERVAL_SECS:
+            return
         try:
-            existing = await asyncio.to_thread(self.client.searches.get_all)
-            if existing:
-                logger.debug("Cleaning %d stale searches", len(existing))
-                for s in existing:
-                    with contextlib.suppress(requests.exceptions.RequestException, KeyError):
-                        await asyncio.to_thread(self.client.searches.delete, id=s["id"])
+            existing = await self._call(self.client.searches.get_all)
+            self._last_cleanup = now
+            if existing and len(existing) >= _CLEANUP_STALE_THRESHOLD:
+                cutoff = datetime.now(UTC).timestamp() - _CLEANUP_MIN_AGE_SECS
+                stale = [s["id"] for s in existing if "id" in s and _search_timestamp(s) < cutoff]
+                logger.debug("Cleaning %d stale searches, keeping %d recent", len(stale), len(existing) - len(stale))
+                await asyncio.gather(*(self._safe_delete(search_id) for search_id in stale), return_exceptions=True)
         except Exception:
             logger.warning("Failed to clean stale searches", exc_info=True)
 
+    async def _safe_delete(self, search_id: str) -> None:
+        """Delete a search, ignoring API errors."""
+        with contextlib.suppress(requests.exceptions.RequestException):
+            await self._call(self.client.searches.delete, id=search_id)
+
     async def _search_inner(self, query: str, timeout_secs: int, response_limit: int) -> list[dict]:
         """Core search logic with polling, stop-on-timeout, and partial results."""
         await self._cleanup_stale_searches()
 
-        search_state = await asyncio.to_thread(
+        search_state = await self._call(
             self.client.searches.search_text,
             searchText=query,
             searchTimeout=timeout_secs * 1000,
@@ -186,14 +389,17 @@ class SlskdClient:
         logger.info(f"Search started: id={search_id}, query='{query}'")
 
         min_wait = 5
+        finished_empty = False
         try:
             start = time.time()
             last_count = 0
             stable_since: float | None = None
+            delay = _POLL_INITIAL_SECS
 
             while time.time() - start < timeout_secs:
-                await asyncio.sleep(2)
-                state = await asyncio.to_thread(self.client.searches.state, id=search_id)
+                await asyncio.sleep(delay)
+                delay = min(delay * _POLL_BACKOFF, _SEARCH_POLL_MAX_SECS)
+                state = await self._call(self.client.searches.state, id=search_id)
 
                 current_count = state.get("fileCount", 0)
                 resp_count = state.get("responseCount", 0)
@@ -210,22 +416,35 @@ class SlskdClient:
 
                 if is_complete and elapsed >= min_wait:
                     logger.info(f"Search completed with {current_count} files from {resp_count} peers")
+                    finished_empty = resp_count == 0 and current_count == 0
                     break
             else:
                 logger.info(
                     f"Search polling timeout ({timeout_secs}s) for '{query}', stopping and grabbing partial results"
                 )
 
+        except asyncio.CancelledError:
+            # The caller gave up (e.g. /cancel): don't leave the search running on slskd
+            logger.info(f"Search cancelled, stopping it on slskd: {query}")
+            with contextlib.suppress(Exception):
+                await self._call(self.client.searches.stop, id=search_id)
+                await self._call(self.client.searches.delete, id=search_id)
+            raise
         except Exception:
             logger.exception(f"Error during search polling for: {query}")
 
+        if finished_empty:
+            # Nothing can arrive after completion; skip the stop and response fetches
+            await self._safe_delete(search_id)
+            return []
+
         # Always stop the search before retrieving responses — slskd returns
         # empty responses array while a search is still in-progress (when
         # responseLimit hasn't been reached but the search hasn't timed out).
         with contextlib.suppress(requests.exceptions.RequestException):
-            await asyncio.to_thread(self.client.searches.stop, id=search_id)
+            await self._call(self.client.searches.stop, id=search_id)
 
-        final_state = await asyncio.to_thread(
+        final_state = await self._call(
             self.client.searches.state,
             id=search_id,
             includeResponses=True,
@@ -243,24 +462,23 @@ class SlskdClient:
                     file_count,
                 )
                 with contextlib.suppress(requests.exceptions.RequestException):
-                    responses = await asyncio.to_thread(
+                    responses = await self._call(
                         self.client.searches.search_responses,
                         id=search_id,
                     )
                 logger.info("search_responses returned %d responses", len(responses))
 
         # Clean up
-        with contextlib.suppress(requests.exceptions.RequestException):
-            await asyncio.to_thread(self.client.searches.delete, id=search_id)
+        await self._safe_delete(search_id)
 
         return responses
 
     async def _stop_and_collect(self, search_id: str) -> list[dict]:
         """Stop a search and return whatever partial results exist."""
         with contextlib.suppress(requests.exceptions.RequestException):
-            await asyncio.to_thread(self.client.searches.stop, id=search_id)
+            await self._call(self.client.searches.stop, id=search_id)
         try:
-            final_state = await asyncio.to_thread(
+            final_state = await self._call(
                 self.client.searches.state,
                 id=search_id,
                 includeResponses=True,
@@ -268,24 +486,28 @@ class SlskdClient:
             responses: list[dict] = final_state.get("responses", [])
             if not responses and final_state.get("responseCount", 0) > 0:
                 with contextlib.suppress(requests.exceptions.RequestException):
-                    responses = await asyncio.to_thread(
+                    responses = await self._call(
                         self.client.searches.search_responses,
                         id=search_id,
                     )
         except Exception:
             logger.exception(f"Failed to collect partial results for {search_id}")
             responses = []
-        with contextlib.suppress(requests.exceptions.RequestException):
-            await asyncio.to_thread(self.client.searches.delete, id=search_id)
+        await self._safe_delete(search_id)
         return responses
 
     # Audio formats accepted in fallback mode (lossless + common lossy)
     AUDIO_EXTENSIONS = {"flac", "alac", "wav", "aiff", "mp3", "aac", "m4a", "ogg", "opus", "wma"}
+    _AUDIO_SUFFIXES = tuple(f".{ext}" for ext in AUDIO_EXTENSIONS)
 
     def parse_results(self, responses: list[dict], flac_only: bool = True) -> list[SearchResult]:
         """
         Parse raw slskd search responses into SearchResult objects.
 
+        Every audio file is parsed on the first call for a given response
+        list; a follow-up call on the same list (e.g. the all-audio fallback
+        after an empty FLAC pass) is served from that parse.
+
         Args:
             responses: Raw responses from slskd search API.
             flac_only: If True, only include FLAC files. If False, include all audio formats.
@@ -293,41 +515,65 @@ class SlskdClient:
         Returns:
             List of SearchResult objects.
         """
-        results = []
-        allowed = {"flac"} if flac_only else self.AUDIO_EXTENSIONS
-
-        for response in responses:
-            username = response.get("username", "")
-            has_free_slot = response.get("hasFreeUploadSlot", False)
-            upload_speed = response.get("uploadSpeed", 0)
-            queue_length = response.get("queueLength", 0)
-
-            for f in response.get("files", []):
-                filename = f.get("filename", "")
-                extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
-
-                if extension not in allowed:
-                    continue
-
-                results.append(
-                    SearchResult(
-                        username=username,
-                        filename=filename,
-                        size=f.get("size", 0),
-                        bit_rate=f.get("bitRate"),
-                        bit_depth=f.get("bitDepth"),
-                        sample_rate=f.get("sampleRate"),
-                        length=f.get("length"),
-                        has_free_slot=has_free_slot,
-                        upload_speed=upload_speed,
-                        queue_length=queue_length,
-                    )
-                )
+        parsed = self._parse_audio(responses)
+        if flac_only:
+            results = [r for is_flac, r in parsed if is_flac]
+        else:
+            results = [r for _, r in parsed]
 
         label = "FLAC" if flac_only else "audio"
         logger.info(f"Parsed {len(results)} {label} results from {len(responses)} responses")
         return results
 
+    def _parse_audio(self, responses: list[dict]) -> list[tuple[bool, SearchResult]]:
+        """Parse every audio file in ``responses``, memoized per response list."""
+        now = time.monotonic()
+        key = id(responses)
+        cached = self._parse_cache.get(key)
+        # The identity check guards against a recycled id() of a freed list
+        if cached is not None and cached[1] is responses and now - cached[0] < _PARSE_CACHE_TTL_SECS:
+            self._parse_cache.move_to_end(key)
+            return cached[2]
+
+        suffixes = self._AUDIO_SUFFIXES
+        # Single-item "for x in [...]" clauses bind per-response/per-file
+        # values; CPython compiles them to plain assignments.
+        parsed = [
+            (
+                filename_lower.endswith(".flac"),
+                SearchResult(
+                    username,
+                    filename,
+                    f.get("size", 0),
+                    f.get("bitRate"),
+                    f.get("bitDepth"),
+                    f.get("sampleRate"),
+                    f.get("length"),
+                    has_free_slot,
+                    upload_speed,
+                    queue_length,
+                ),
+            )
+            for response in responses
+            for username, has_free_slot, upload_speed, queue_length in [
+                (
+                    response.get("username", ""),
+                    response.get("hasFreeUploadSlot", False),
+                    response.get("uploadSpeed", 0),
+                    response.get("queueLength", 0),
+                )
+            ]
+            for f in response.get("files", ())
+            for filename in [f.get("filename", "")]
+            for filename_lower in [filename.lower()]
+            if filename_lower.endswith(suffixes)
+        ]
+
+        self._parse_cache[key] = (now, responses, parsed)
+        while len(self._parse_cache) > _PARSE_CACHE_MAX_ENTRIES:
+            self._parse_cache.popitem(last=False)
+        return parsed
+
     def enqueue_download(self, result: SearchResult) -> bool:
         """
         Enqueue a file for download via slskd.
@@ -341,12 +587,26 @@ class SlskdClient:
         try:
             files = [{"filename": result.filename, "size": result.size}]
             self.client.transfers.enqueue(username=result.username, files=files)
+            self._invalidate_responses(("downloads", result.username), ("downloads_dir",))
             logger.info(f"Enqueued download: {result.basename} from {result.username}")
             return True
         except Exception:
             logger.exception(f"Failed to enqueue download: {result.basename}")
             return False
 
+    @staticmethod
+    def _transfer_status(username: str, transfer: dict) -> DownloadStatus:
+        return DownloadStatus(
+            username=username,
+            filename=transfer.get("filename", ""),
+            state=transfer.get("state", "Unknown"),
+            percent_complete=transfer.get("percentComplete", 0),
+            bytes_transferred=transfer.get("bytesTransferred", 0),
+            size=transfer.get("size", 0),
+            average_speed=transfer.get("averageSpeed", 0),
+            id=transfer.get("id", ""),
+        )
+
     def get_download_status(self, username: str, filename: str) -> DownloadStatus | None:
         """
         Get the download status for a specific file.
@@ -359,7 +619,7 @@ class SlskdClient:
             DownloadStatus or None if not found.
         """
         try:
-            downloads = self.client.transfers.get_downloads(username=username)
+            downloads = self._cached_fetch(("downloads", username), self.client.transfers.get_downloads, username)
 
             if not downloads:
                 return None
@@ -368,15 +628,7 @@ class SlskdClient:
             for directory in downloads.get("directories", []):
                 for transfer in directory.get("files", []):
                     if transfer.get("filename") == filename:
-                        return DownloadStatus(
-                            username=username,
-                            filename=filename,
-                            state=transfer.get("state", "Unknown"),
-                            percent_complete=transfer.get("percentComplete", 0),
-                            bytes_transferred=transfer.get("bytesTransferred", 0),
-                            size=transfer.get("size", 0),
-                            average_speed=transfer.get("averageSpeed", 0),
-                        )
+                        return self._transfer_status(username, transfer)
 
             return None
 
@@ -384,9 +636,40 @@ class SlskdClient:
             logger.exception(f"Failed to get download status for {filename}")
             return None
 
+    def get_all_download_statuses(
+        self, keys: set[tuple[str, str]] | None = None
+    ) -> dict[tuple[str, str], DownloadStatus]:
+        """
+        Get the status of every download in one request.
+
+        Args:
+            keys: If given, only build statuses for these (username, filename)
+                pairs; slskd also lists finished transfers, which a poller
+                has no use for.
+
+        Returns:
+            Mapping of (username, remote filename) to DownloadStatus; empty on error.
+        """
+        try:
+            statuses = {}
+            for user in self.client.transfers.get_all_downloads() or []:
+                username = user.get("username", "")
+                for directory in user.get("directories", []):
+                    for transfer in directory.get("files", []):
+                        key = (username, transfer.get("filename", ""))
+                        if keys is None or key in keys:
+                            statuses[key] = self._transfer_status(username, transfer)
+            return statuses
+        except Exception:
+            logger.exception("Failed to get download statuses")
+            return {}
+
     async def wait_for_download(self, username: str, filename: str, timeout_secs: int = 600) -> DownloadStatus | None:
         """
-        Wait for a download to complete, polling periodically.
+        Wait for a download to complete or fail.
+
+        All concurrent waiters share one poller, so N parallel downloads cost
+        one transfers request per tick instead of N.
 
         Args:
             username: Source username.
@@ -396,33 +679,94 @@ class SlskdClient:
         Returns:
             Final DownloadStatus, or None on timeout.
         """
-        start = time.time()
-
-        while time.time() - start < timeout_secs:
-            await asyncio.sleep(3)
-            status = self.get_download_status(username, filename)
+        key = (username, filename)
+        future = asyncio.get_running_loop().create_future()
+        self._download_watchers.setdefault(key, []).append(future)
+        if self._download_poller is None:
+            self._download_poller = asyncio.create_task(self._poll_downloads())
 
-            if status is None:
-                logger.debug(f"No status yet for {filename}")
-                continue
+        try:
+            async with asyncio.timeout(timeout_secs):
+                return await future
+        except TimeoutError:
+            logger.warning(f"Download timed out after {timeout_secs}s: {filename}")
+            return None
+        except asyncio.CancelledError:
+            # Cancel the transfer too, unless someone else is still waiting for it
+            self._unwatch(key, future)
+            if key not in self._download_watchers:
+                await self._call(self.cancel_download, username, filename)
+            raise
+        finally:
+            self._unwatch(key, future)
+
+    def _unwatch(self, key: tuple[str, str], future: asyncio.Future) -> None:
+        watchers = self._download_watchers.get(key, [])
+        if future in watchers:
+            watchers.remove(future)
+        if not watchers:
+            self._download_watchers.pop(key, None)
+
+    def cancel_download(self, username: str, filename: str) -> bool:
+        """
+        Cancel an active download on slskd.
 
-            if status.is_complete:
-                logger.info(f"Download complete: {filename}")
-                return status
+        Args:
+            username: Source username.
+            filename: Remote filename.
 
-            if status.is_failed:
-                logger.warning(f"Download failed ({status.state}): {filename}")
-                return status
+        Returns:
+            True if a transfer was cancelled.
+        """
+        status = self.get_download_status(username, filename)
+        if status is None or not status.is_active or not status.id:
+            return False
+        try:
+            cancelled = bool(self.client.transfers.cancel_download(username=username, id=status.id))
+            logger.info(f"Cancelled download: {filename}")
+            return cancelled
+        except Exception:
+            logger.exception(f"Failed to cancel download: {filename}")
+            return False
 
-            logger.debug(f"Download {status.percent_complete:.0f}%: {filename}")
+    async def _poll_downloads(self) -> None:
+        """
+        Poll all transfers until no waiter is left, resolving finished ones.
 
-        logger.warning(f"Download timed out after {timeout_secs}s: {filename}")
-        return None
+        This is the only periodic timer for downloads: waiters just await
+        their future, so N concurrent downloads schedule one sleep per tick.
+        """
+        try:
+            delay = _POLL_INITIAL_SECS
+            while self._download_watchers:
+                await asyncio.sleep(delay)
+                delay = min(delay * _POLL_BACKOFF, _DOWNLOAD_POLL_MAX_SECS)
+                statuses = await self._call(self.get_all_download_statuses, set(self._download_watchers))
+
+                for key, futures in list(self._download_watchers.items()):
+                    status = statuses.get(key)
+                    if status is None:
+                        logger.debug(f"No status yet for {key[1]}")
+                        continue
+
+                    if status.is_complete:
+                        logger.info(f"Download complete: {key[1]}")
+                    elif status.is_failed:
+                        logger.warning(f"Download failed ({status.state}): {key[1]}")
+                    else:
+                        logger.debug(f"Download {status.percent_complete:.0f}%: {key[1]}")
+                        continue
+
+                    for future in futures:
+                        if not future.done():
+                            future.set_result(status)
+        finally:
+            self._download_poller = None
 
     def get_downloads_directory(self) -> list[dict]:
         """Get the contents of the slskd downloads directory."""
         try:
-            return self.client.files.get_downloads_dir()
+            return self._cached_fetch(("downloads_dir",), self.client.files.get_downloads_dir)
         except Exception:
             logger.exception("Failed to list downloads directory")
             return []
@@ -4,42 +4,194 @@ Embed album artwork from Spotify into a single audio file.
 Reusable by both the batch embedder and the Telegram bot.
 """
 
+import atexit
 import logging
+import os
+import threading
+from collections import OrderedDict
 
 import httpx
 import mutagen.flac
 import mutagen.mp4
 import spotipy
 
+try:
+    import h2  # noqa: F401
+
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 logger = logging.getLogger(__name__)
 
+_FLAC_PICTURE_BLOCK = 6
+
+# Embedding a cover rarely fits the padding an encoder leaves, so the first
+# save rewrites the file anyway; leave generous padding behind so later tag
+# edits overwrite the metadata in place instead of copying the audio again.
+_MIN_PADDING_BYTES = 64 * 1024
+
+# Compilations and re-rips share (artist, title) pairs and album covers, so
+# lookups and image downloads are memoized for the life of the process.
+_ARTWORK_URL_CACHE_MAX_ENTRIES = 4096
+_IMAGE_CACHE_MAX_ENTRIES = 64
+# Spotify covers top out around 1.5 MB; anything larger is not a cover.
+_MAX_IMAGE_BYTES = 10 * 1024 * 1024
+_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# One pooled client for every cover download: Spotify serves artwork from a
+# handful of i.scdn.co hosts, so keep-alive skips the per-image TLS handshake.
+# With h2 installed, concurrent downloads are multiplexed over one connection.
+_CLIENT = httpx.Client(
+    timeout=15,
+    follow_redirects=True,
+    http2=HAS_HTTP2,
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=4),
+)
+atexit.register(_CLIENT.close)
+
+# (artist, title) -> cover URL.  Only hits are stored: a track Spotify
+# doesn't know yet (or a transient empty response) is looked up again.
+_artwork_url_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+_artwork_url_cache_lock = threading.Lock()
+
+_image_cache: OrderedDict[str, bytes] = OrderedDict()
+_image_cache_lock = threading.Lock()
+
+
+def _artwork_url(sp: spotipy.Spotify, artist: str, title: str) -> str | None:
+    """Return the album cover URL for a normalized (artist, title) pair."""
+    key = (artist, title)
+    with _artwork_url_cache_lock:
+        url = _artwork_url_cache.get(key)
+        if url is not None:
+            _artwork_url_cache.move_to_end(key)
+            return url
+
+    query = f"{artist} {title}"
+    results = sp.search(q=query, type="track", limit=1)
+    tracks = results.get("tracks", {}).get("items", [])
+    if not tracks:
+        logger.debug("No Spotify results for artwork: %s", query)
+        return None
+    images = tracks[0].get("album", {}).get("images", [])
+    if not images:
+        return None
+    url = images[0]["url"]
+
+    with _artwork_url_cache_lock:
+        _artwork_url_cache[key] = url
+        while len(_artwork_url_cache) > _ARTWORK_URL_CACHE_MAX_ENTRIES:
+            _artwork_url_cache.popitem(last=False)
+    return url
+
+
+def _download_image(url: str) -> bytes:
+    """Download an image, serving repeated URLs from a small LRU cache."""
+    with _image_cache_lock:
+        data = _image_cache.get(url)
+        if data is not None:
+            _image_cache.move_to_end(url)
+            return data
+
+    with _CLIENT.stream("GET", url) as resp:
+        resp.raise_for_status()
+        declared = int(resp.headers.get("content-length") or 0)
+        if declared > _MAX_IMAGE_BYTES:
+            raise ValueError(f"Artwork too large ({declared} bytes): {url}")
+        buf = bytearray()
+        for chunk in resp.iter_bytes(_DOWNLOAD_CHUNK_BYTES):
+            buf += chunk
+            if len(buf) > _MAX_IMAGE_BYTES:
+                raise ValueError(f"Artwork exceeds {_MAX_IMAGE_BYTES} bytes: {url}")
+    data = bytes(buf)
+
+    with _image_cache_lock:
+        _image_cache[url] = data
+        while len(_image_cache) > _IMAGE_CACHE_MAX_ENTRIES:
+            _image_cache.popitem(last=False)
+    return data
+
 
 def fetch_spotify_artwork(sp: spotipy.Spotify, artist: str, title: str) -> bytes | None:
     """Search Spotify for a track and return album artwork bytes (JPEG)."""
-    query = f"{artist} {title}"
     try:
-        results = sp.search(q=query, type="track", limit=1)
-        tracks = results.get("tracks", {}).get("items", [])
-        if not tracks:
-            logger.debug("No Spotify results for artwork: %s", query)
+        url = _artwork_url(sp, artist.lower().strip(), title.lower().strip())
+        if not url:
             return None
-        images = tracks[0].get("album", {}).get("images", [])
-        if not images:
-            return None
-        url = images[0]["url"]
-        resp = httpx.get(url, timeout=15, follow_redirects=True)
-        resp.raise_for_status()
-        return resp.content
+        return _download_image(url)
     except Exception:
         logger.debug("Spotify artwork fetch failed for: %s - %s", artist, title, exc_info=True)
         return None
 
 
+def _flac_has_picture(filepath: str) -> bool | None:
+    """
+    Walk the FLAC metadata block headers looking for a PICTURE block.
+
+    Only the 4-byte block headers are read; block bodies (Vorbis comments,
+    seek tables, the pictures themselves) are skipped with a relative seek.
+    An ID3v2-prefixed file is left to mutagen.  Returns None for anything
+    else without the ``fLaC`` marker (truncated or mislabelled downloads)
+    without ever parsing it.
+    """
+    with open(filepath, "rb") as f:
+        magic = f.read(4)
+        if magic != b"fLaC":
+            if magic.startswith(b"ID3"):
+                return bool(mutagen.flac.FLAC(filepath).pictures)
+            return None
+        while True:
+            header = f.read(4)
+            if len(header) < 4:
+                return False
+            if header[0] & 0x7F == _FLAC_PICTURE_BLOCK:
+                return True
+            if header[0] & 0x80:
+                return False
+            f.seek(int.from_bytes(header[1:], "big"), os.SEEK_CUR)
+
+
+def _is_flac_data(filepath: str) -> bool:
+    """True if the file starts with the ``fLaC`` marker or an ID3v2 tag mutagen skips."""
+    with open(filepath, "rb") as f:
+        magic = f.read(4)
+    return magic == b"fLaC" or magic.startswith(b"ID3")
+
+
+def has_artwork(filepath: str) -> bool | None:
+    """
+    Return True if a FLAC or M4A file already carries embedded artwork.
+
+    Returns None when the file cannot take artwork at all (not FLAC data
+    despite the extension, an unsupported format, or unreadable), so callers
+    can skip the Spotify lookup as well as the embed.
+    """
+    ext = filepath.rsplit(".", 1)[-1].lower() if "." in filepath else ""
+    try:
+        if ext == "flac":
+            return _flac_has_picture(filepath)
+        if ext in ("m4a", "mp4", "alac", "aac"):
+            tags = mutagen.mp4.MP4(filepath).tags
+            return bool(tags and tags.get("covr"))
+    except Exception:
+        logger.debug("Failed to read artwork from %s", filepath, exc_info=True)
+    return None
+
+
+def _keep_padding(info: mutagen.PaddingInfo) -> int:
+    """mutagen padding callback: never shrink below ``_MIN_PADDING_BYTES``."""
+    return max(info.padding, _MIN_PADDING_BYTES)
+
+
 def embed_artwork_into_file(filepath: str, image_data: bytes) -> bool:
     """Embed JPEG artwork into a FLAC or M4A file. Returns True on success."""
     ext = filepath.rsplit(".", 1)[-1].lower() if "." in filepath else ""
     try:
         if ext == "flac":
+            if not _is_flac_data(filepath):
+                logger.debug("Not FLAC data, skipping artwork: %s", filepath)
+                return False
             f = mutagen.flac.FLAC(filepath)
             if f.pictures:
                 return False
@@ -48,16 +200,17 @@ def embed_artwork_into_file(filepath: str, image_data: bytes) -> bool:
             pic.mime = "image/jpeg"
             pic.desc = "Cover"
             pic.data = image_data
-            f.clear_pictures()
             f.add_picture(pic)
-            f.save()
+            f.save(padding=_keep_padding)
             return True
         elif ext in ("m4a", "mp4", "alac", "aac"):
             f = mutagen.mp4.MP4(filepath)
-            if f.tags and f.tags.get("covr"):
+            if f.tags is None:
+                f.add_tags()
+            elif f.tags.get("covr"):
                 return False
             f.tags["covr"] = [mutagen.mp4.MP4Cover(image_data, imageformat=mutagen.mp4.MP4Cover.FORMAT_JPEG)]
-            f.save()
+            f.save(padding=_keep_padding)
             return True
         else:
             logger.debug("Unsupported format for artwork embedding: %s", ext)
@@ -89,6 +89,15 @@ class TestConfig:
             config = Config()
             assert config.exclude_keywords == ["live", "remix", "demo"]
 
+    def test_exclude_keywords_deduplicated(self, env_vars):
+        """Repeated exclude keywords are collapsed, keeping first-seen order."""
+        env_vars["EXCLUDE_KEYWORDS"] = "live, Remix,live,remix"
+        with patch.dict(os.environ, env_vars, clear=False):
+            from music_downloader.config import Config
+
+            config = Config()
+            assert config.exclude_keywords == ["live", "remix"]
+
     def test_custom_filename_template(self, env_vars):
         """Config accepts custom filename template."""
         env_vars["FILENAME_TEMPLATE"] = "{title} by {artist}"
@@ -97,3 +106,34 @@ class TestConfig:
 
             config = Config()
             assert config.filename_template == "{title} by {artist}"
+
+    def test_config_is_immutable(self, env_vars):
+        """Config instances are frozen once loaded."""
+        import dataclasses
+
+        with patch.dict(os.environ, env_vars, clear=False):
+            from music_downloader.config import Config
+
+            config = Config()
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                config.max_results = 5
+
+    def test_invalid_max_results_raises(self, env_vars):
+        """MAX_RESULTS below 1 is rejected at load time."""
+        env_vars["MAX_RESULTS"] = "0"
+        with patch.dict(os.environ, env_vars, clear=False):
+            from music_downloader.config import Config
+
+            with pytest.raises(ValueError, match="MAX_RESULTS"):
+                Config()
+
+    def test_get_config_is_cached(self, env_vars):
+        """get_config reads the environment once and reuses the instance."""
+        with patch.dict(os.environ, env_vars, clear=False):
+            from music_downloader.config import get_config
+
+            get_config.cache_clear()
+            try:
+                assert get_config() is get_config()
+            finally:
+                get_config.cache_clear()
@@ -5,8 +5,14 @@ from unittest.mock import MagicMock, patch
 
 import mutagen.flac
 import mutagen.mp4
+import pytest
 
-from music_downloader.tools.embed_artwork import embed_artwork_into_file, fetch_spotify_artwork
+from music_downloader.tools import embed_artwork
+from music_downloader.tools.embed_artwork import (
+    embed_artwork_into_file,
+    fetch_spotify_artwork,
+    has_artwork,
+)
 
 
 def _create_test_flac(path: str, with_art: bool = False) -> None:
@@ -53,20 +59,86 @@ def _create_test_flac(path: str, with_art: bool = False) -> None:
         audio.save()
 
 
+def _mock_stream(mock_client: MagicMock, chunks: list[bytes], headers: dict | None = None) -> MagicMock:
+    """Make ``mock_client.stream(...)`` yield a response streaming ``chunks``."""
+    resp = mock_client.stream.return_value.__enter__.return_value
+    resp.headers = headers or {}
+    resp.iter_bytes.return_value = chunks
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def _clear_artwork_caches():
+    embed_artwork._artwork_url_cache.clear()
+    embed_artwork._image_cache.clear()
+    yield
+
+
 class TestFetchSpotifyArtwork:
     def test_returns_bytes_on_success(self):
         mock_sp = MagicMock()
         mock_sp.search.return_value = {
             "tracks": {"items": [{"album": {"images": [{"url": "https://example.com/art.jpg"}]}}]}
         }
-        with patch("music_downloader.tools.embed_artwork.httpx") as mock_httpx:
-            mock_resp = MagicMock()
-            mock_resp.content = b"\xff\xd8\xff\xe0JFIF"
-            mock_resp.raise_for_status = MagicMock()
-            mock_httpx.get.return_value = mock_resp
+        with patch("music_downloader.tools.embed_artwork._CLIENT") as mock_client:
+            _mock_stream(mock_client, [b"\xff\xd8", b"\xff\xe0JFIF"])
             result = fetch_spotify_artwork(mock_sp, "Artist", "Title")
             assert result == b"\xff\xd8\xff\xe0JFIF"
 
+    def test_repeated_lookups_are_cached(self):
+        mock_sp = MagicMock()
+        mock_sp.search.return_value = {
+            "tracks": {"items": [{"album": {"images": [{"url": "https://example.com/art.jpg"}]}}]}
+        }
+        with patch("music_downloader.tools.embed_artwork._CLIENT") as mock_client:
+            _mock_stream(mock_client, [b"\xff\xd8"])
+            assert fetch_spotify_artwork(mock_sp, "Artist", "Title") == b"\xff\xd8"
+            assert fetch_spotify_artwork(mock_sp, " artist ", "TITLE") == b"\xff\xd8"
+            # Another track on the same album reuses the downloaded cover
+            assert fetch_spotify_artwork(mock_sp, "Artist", "Other Track") == b"\xff\xd8"
+        assert mock_sp.search.call_count == 2
+        mock_client.stream.assert_called_once_with("GET", "https://example.com/art.jpg")
+
+    def test_oversized_image_is_rejected(self):
+        mock_sp = MagicMock()
+        mock_sp.search.return_value = {
+            "tracks": {"items": [{"album": {"images": [{"url": "https://example.com/huge.jpg"}]}}]}
+        }
+        with patch("music_downloader.tools.embed_artwork._CLIENT") as mock_client:
+            _mock_stream(mock_client, [], headers={"content-length": str(50 * 1024 * 1024)})
+            assert fetch_spotify_artwork(mock_sp, "Artist", "Title") is None
+        assert not embed_artwork._image_cache
+
+    def test_misses_are_not_cached(self):
+        mock_sp = MagicMock()
+        mock_sp.search.side_effect = [
+            {"tracks": {"items": []}},
+            {"tracks": {"items": [{"album": {"images": [{"url": "https://example.com/art.jpg"}]}}]}},
+        ]
+        with patch("music_downloader.tools.embed_artwork._CLIENT") as mock_client:
+            _mock_stream(mock_client, [b"\xff\xd8"])
+            assert fetch_spotify_artwork(mock_sp, "Artist", "New Single") is None
+            assert fetch_spotify_artwork(mock_sp, "Artist", "New Single") == b"\xff\xd8"
+        assert mock_sp.search.call_count == 2
+
+    def test_cache_is_shared_across_clients(self):
+        first_sp, second_sp = MagicMock(), MagicMock()
+        first_sp.search.return_value = {
+            "tracks": {"items": [{"album": {"images": [{"url": "https://example.com/art.jpg"}]}}]}
+        }
+        with patch("music_downloader.tools.embed_artwork._CLIENT") as mock_client:
+            _mock_stream(mock_client, [b"\xff\xd8"])
+            assert fetch_spotify_artwork(first_sp, "Artist", "Title") == b"\xff\xd8"
+            assert fetch_spotify_artwork(second_sp, "Artist", "Title") == b"\xff\xd8"
+        second_sp.search.assert_not_called()
+
+    def test_failed_lookup_is_retried(self):
+        mock_sp = MagicMock()
+        mock_sp.search.side_effect = [Exception("rate limited"), {"tracks": {"items": []}}]
+        assert fetch_spotify_artwork(mock_sp, "Artist", "Title") is None
+        assert fetch_spotify_artwork(mock_sp, "Artist", "Title") is None
+        assert mock_sp.search.call_count == 2
+
     def test_returns_none_no_tracks(self):
         mock_sp = MagicMock()
         mock_sp.search.return_value = {"tracks": {"items": []}}
@@ -96,6 +168,14 @@ class TestEmbedArtworkIntoFile:
         audio = mutagen.flac.FLAC(flac_path)
         assert len(audio.pictures) == 1
 
+    def test_embed_leaves_padding_for_later_edits(self, tmp_path):
+        flac_path = str(tmp_path / "test.flac")
+        _create_test_flac(flac_path)
+        assert embed_artwork_into_file(flac_path, b"\xff\xd8\xff\xe0" + b"\x00" * 100_000) is True
+        audio = mutagen.flac.FLAC(flac_path)
+        padding = [b for b in audio.metadata_blocks if isinstance(b, mutagen.flac.Padding)]
+        assert padding and padding[0].length >= 64 * 1024
+
     def test_skip_flac_with_existing_art(self, tmp_path):
         flac_path = str(tmp_path / "test.flac")
         _create_test_flac(flac_path, with_art=True)
@@ -123,6 +203,16 @@ class TestEmbedArtworkIntoFile:
             result = embed_artwork_into_file(m4a_path, b"\xff\xd8\xff\xe0")
             assert result is True
 
+    def test_embed_into_untagged_m4a(self, tmp_path):
+        m4a_path = str(tmp_path / "test.m4a")
+        with patch("music_downloader.tools.embed_artwork.mutagen.mp4.MP4") as mock_mp4:
+            mock_file = mock_mp4.return_value
+            mock_file.tags = None
+            mock_file.add_tags.side_effect = lambda: setattr(mock_file, "tags", {})
+            assert embed_artwork_into_file(m4a_path, b"\xff\xd8\xff\xe0") is True
+        assert "covr" in mock_file.tags
+        mock_file.save.assert_called_once()
+
     def test_embed_m4a_with_existing_art(self, tmp_path):
         m4a_path = str(tmp_path / "test.m4a")
         with open(m4a_path, "wb") as f:
@@ -148,3 +238,32 @@ class TestEmbedArtworkIntoFile:
             f.write("data")
         result = embed_artwork_into_file(path, b"\x00")
         assert result is False
+
+
+class TestHasArtwork:
+    def test_flac_header_walk(self, tmp_path):
+        plain = str(tmp_path / "plain.flac")
+        tagged = str(tmp_path / "tagged.flac")
+        _create_test_flac(plain)
+        _create_test_flac(tagged, with_art=True)
+        with patch("music_downloader.tools.embed_artwork.mutagen.flac.FLAC") as mock_flac:
+            assert has_artwork(plain) is False
+            assert has_artwork(tagged) is True
+        mock_flac.assert_not_called()
+
+    def test_id3_prefixed_flac_falls_back_to_mutagen(self, tmp_path):
+        path = str(tmp_path / "id3.flac")
+        with open(path, "wb") as f:
+            f.write(b"ID3" + b"\x00" * 20)
+        with patch("music_downloader.tools.embed_artwork.mutagen.flac.FLAC") as mock_flac:
+            mock_flac.return_value.pictures = [MagicMock()]
+            assert has_artwork(path) is True
+
+    def test_non_flac_data_skips_mutagen(self, tmp_path):
+        path = str(tmp_path / "partial.flac")
+        with open(path, "wb") as f:
+            f.write(b"\x00" * 64)
+        with patch("music_downloader.tools.embed_artwork.mutagen.flac.FLAC") as mock_flac:
+            assert has_artwork(path) is None
+            assert embed_artwork_into_file(path, b"\xff\xd8\xff\xe0") is False
+        mock_flac.assert_not_called()
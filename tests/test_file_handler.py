@@ -1,6 +1,9 @@
 """Tests for the file processor."""
 
+import errno
 import os
+from pathlib import Path
+from unittest.mock import patch
 
 import mutagen.flac
 import pytest
@@ -44,11 +47,32 @@ class TestFileProcessor:
         assert result is not None
         assert result.endswith("song.flac")
 
+    def test_find_downloaded_file_nested(self, processor, tmp_path):
+        """Test finding a file several directories below the user folder."""
+        nested = tmp_path / "downloads" / "someuser" / "Artist" / "Album"
+        nested.mkdir(parents=True)
+        (nested / "song.flac").write_text("fake flac data")
+        # A directory with the same name must not be returned
+        (tmp_path / "downloads" / "someuser" / "Artist" / "song.flac").mkdir()
+
+        result = processor.find_downloaded_file("someuser", "\\Music\\Artist\\song.flac")
+        assert result == str(nested / "song.flac")
+
     def test_find_downloaded_file_not_found(self, processor):
         """Test that None is returned when file doesn't exist."""
         result = processor.find_downloaded_file("nobody", "\\Music\\nonexistent.flac")
         assert result is None
 
+    def test_find_downloaded_file_rejects_traversal_in_remote_name(self, processor, tmp_path):
+        """Test that a "../" remote filename cannot reach files outside the download dir."""
+        (tmp_path / "downloads" / "someuser").mkdir()
+        outside = tmp_path / "lib"
+        outside.mkdir()
+        (outside / "x.flac").write_text("not a download")
+
+        result = processor.find_downloaded_file("someuser", "\\Music\\../../lib/x.flac")
+        assert result is None
+
     def test_process_file(self, processor, tmp_path):
         """Test renaming and moving a file."""
         # Create a source file
@@ -98,6 +122,66 @@ class TestFileProcessor:
         assert os.path.exists(result1)
         assert os.path.exists(result2)
 
+    def test_process_file_skips_taken_suffixes(self, processor, tmp_path):
+        """Test that the first free numeric suffix is used."""
+        output_dir = tmp_path / "output"
+        for name in ("Artist - Song.flac", "Artist - Song (1).flac", "Artist - Song (2).flac"):
+            (output_dir / name).write_text("existing")
+        source = tmp_path / "source.flac"
+        source.write_text("data")
+
+        result = processor.process_file(str(source), "Artist", "Song")
+        assert result == str(output_dir / "Artist - Song (3).flac")
+
+    def test_process_file_move_renames_on_same_device(self, processor, tmp_path):
+        """Test that move=True renames the source and prunes its emptied folder."""
+        user_dir = tmp_path / "downloads" / "someuser"
+        user_dir.mkdir()
+        source = user_dir / "song.flac"
+        source.write_text("fake flac data")
+        inode = source.stat().st_ino
+
+        with patch("music_downloader.processor.file_handler.shutil.copy2") as mock_copy:
+            result = processor.process_file(str(source), "Artist", "Song", move=True)
+
+        mock_copy.assert_not_called()
+        assert os.stat(result).st_ino == inode
+        assert not user_dir.exists()
+        assert processor.cleanup_download(str(source)) is False
+
+    def test_process_file_move_survives_failed_prune(self, processor, tmp_path):
+        """Test that a failed rmdir of the source folder does not fail the move."""
+        user_dir = tmp_path / "downloads" / "someuser"
+        user_dir.mkdir()
+        source = user_dir / "song.flac"
+        source.write_text("fake flac data")
+
+        with patch("music_downloader.processor.file_handler.os.rmdir", side_effect=OSError("busy")):
+            result = processor.process_file(str(source), "Artist", "Song", move=True)
+
+        assert result == str(tmp_path / "output" / "Artist - Song.flac")
+        assert os.path.exists(result)
+        assert user_dir.exists()
+
+    def test_process_file_move_falls_back_to_copy_on_exdev(self, processor, tmp_path):
+        """Test that a refused rename (separate bind mounts) still places the file."""
+        source = tmp_path / "downloads" / "song.flac"
+        source.write_text("fake flac data")
+        real_replace = os.replace
+
+        def replace(src, dst):
+            if src == str(source):
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            real_replace(src, dst)
+
+        with patch("music_downloader.processor.file_handler.os.replace", side_effect=replace):
+            result = processor.process_file(str(source), "Artist", "Song", move=True)
+
+        assert result == str(tmp_path / "output" / "Artist - Song.flac")
+        assert Path(result).read_text() == "fake flac data"
+        assert source.exists()
+        assert not os.path.exists(result + ".importing")
+
     def test_cleanup_download(self, processor, tmp_path):
         """Test cleaning up downloaded files."""
         source = tmp_path / "cleanup_test.flac"
@@ -1,8 +1,12 @@
 """Extended tests for file_handler - covering find_similar and edge cases."""
 
+from difflib import SequenceMatcher
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 
-from music_downloader.processor.file_handler import FileProcessor
+from music_downloader.processor.file_handler import HAS_WATCHDOG, FileProcessor, _FileIndex, _sequence_ratio
 
 
 class TestFindSimilar:
@@ -14,6 +18,14 @@ class TestFindSimilar:
         output_dir.mkdir()
         return FileProcessor(str(download_dir), str(output_dir))
 
+    def test_sequence_ratio_cutoff(self):
+        assert _sequence_ratio("bang bang", "bang bang", 0.9) == 1.0
+        assert _sequence_ratio("nancy sinatra bang bang", "nancy sinatra bang bong", 0.6) > 0.9
+        assert _sequence_ratio("nancy sinatra", "zzzz", 0.6) == 0.0
+        # Above the cutoff the value is difflib's own ratio
+        a, b = "nancy sinatra bang bang", "nancy sinatra - bang bang (mono)"
+        assert _sequence_ratio(a, b, 0.6) == SequenceMatcher(None, a, b).ratio()
+
     def test_no_output_dir(self, tmp_path):
         p = FileProcessor(str(tmp_path / "dl"), str(tmp_path / "nonexistent"))
         result = p.find_similar("test")
@@ -40,6 +52,11 @@ class TestFindSimilar:
         result = processor.find_similar("Nancy Sinatra Bang Bang")
         assert result == []
 
+    def test_ignores_directories(self, processor, tmp_path):
+        output_dir = tmp_path / "output"
+        (output_dir / "Nancy Sinatra - Bang Bang.flac").mkdir()
+        assert processor.find_similar("Nancy Sinatra Bang Bang") == []
+
     def test_sorted_by_similarity(self, processor, tmp_path):
         output_dir = tmp_path / "output"
         (output_dir / "Nancy Sinatra - Bang Bang.flac").write_text("data")
@@ -129,6 +146,29 @@ class TestCleanupDownload:
         assert not source.exists()
         assert not parent.exists()
 
+    def test_cleanup_keeps_non_empty_parent(self, tmp_path):
+        download_dir = tmp_path / "downloads"
+        parent = download_dir / "user"
+        parent.mkdir(parents=True)
+        (parent / "other.flac").write_text("still downloading")
+        source = parent / "song.flac"
+        source.write_text("data")
+        processor = FileProcessor(str(download_dir), str(tmp_path / "output"))
+        assert processor.cleanup_download(str(source)) is True
+        assert parent.exists()
+
+    def test_cleanup_ignores_failed_rmdir(self, tmp_path):
+        """A folder that refills between the check and the rmdir is left alone."""
+        parent = tmp_path / "downloads" / "user"
+        parent.mkdir(parents=True)
+        source = parent / "song.flac"
+        source.write_text("data")
+        processor = FileProcessor(str(tmp_path / "downloads"), str(tmp_path / "output"))
+        with patch("music_downloader.processor.file_handler.os.rmdir", side_effect=OSError("not empty")):
+            assert processor.cleanup_download(str(source)) is True
+        assert not source.exists()
+        assert parent.exists()
+
     def test_cleanup_nonexistent(self, tmp_path):
         download_dir = tmp_path / "downloads"
         output_dir = tmp_path / "output"
@@ -146,3 +186,67 @@ class TestCleanupDownload:
         processor = FileProcessor(str(download_dir), str(output_dir), filename_template="{title} by {artist}")
         result = processor.build_filename("Artist", "Song", "mp3")
         assert result == "Song by Artist.mp3"
+
+
+class TestFileIndex:
+    def test_seed_and_lookup_is_scoped_to_directory(self, tmp_path):
+        for user in ("alice", "bob"):
+            d = tmp_path / user / "Album"
+            d.mkdir(parents=True)
+            (d / "song.flac").write_text("data")
+        (tmp_path / "carol").mkdir()
+
+        index = _FileIndex(str(tmp_path))
+        assert not index.ready.is_set()
+        index.seed()
+        assert index.ready.is_set()
+        assert index.lookup("song.flac", str(tmp_path / "bob")) == str(tmp_path / "bob" / "Album" / "song.flac")
+        assert index.lookup("song.flac", str(tmp_path / "carol")) is None
+        assert index.lookup("missing.flac", str(tmp_path / "bob")) is None
+
+    def test_lookup_drops_stale_paths(self, tmp_path):
+        index = _FileIndex(str(tmp_path))
+        index.add(str(tmp_path / "gone.flac"))
+        assert index.lookup("gone.flac", str(tmp_path)) is None
+        assert "gone.flac" not in index._paths
+
+    def test_dispatch_tracks_moves(self, tmp_path):
+        src = tmp_path / "incomplete" / "song.flac"
+        dest = tmp_path / "user" / "song.flac"
+        dest.parent.mkdir()
+        dest.write_text("data")
+        index = _FileIndex(str(tmp_path))
+        index.dispatch(SimpleNamespace(event_type="created", is_directory=False, src_path=str(src)))
+        index.dispatch(SimpleNamespace(event_type="moved", is_directory=False, src_path=str(src), dest_path=str(dest)))
+        assert index._paths == {"song.flac": [str(dest)]}
+
+    @pytest.mark.skipif(not HAS_WATCHDOG, reason="watchdog not installed")
+    def test_processor_uses_index(self, tmp_path):
+        download_dir = tmp_path / "downloads"
+        (download_dir / "user" / "Album").mkdir(parents=True)
+        (download_dir / "user" / "Album" / "song.flac").write_text("data")
+        processor = FileProcessor(str(download_dir), str(tmp_path / "output"))
+        try:
+            assert processor._index is not None
+            assert processor._index.ready.wait(5)
+            with patch("music_downloader.processor.file_handler._find_by_name") as mock_find:
+                assert processor.find_downloaded_file("user", "\\Music\\song.flac") is not None
+                mock_find.assert_not_called()
+        finally:
+            processor.close()
+        assert processor._index is None
+
+    @pytest.mark.skipif(not HAS_WATCHDOG, reason="watchdog not installed")
+    def test_index_hit_from_another_user_is_not_used(self, tmp_path):
+        download_dir = tmp_path / "downloads"
+        (download_dir / "other" / "Album").mkdir(parents=True)
+        (download_dir / "other" / "Album" / "song.flac").write_text("data")
+        (download_dir / "user").mkdir()
+        processor = FileProcessor(str(download_dir), str(tmp_path / "output"))
+        try:
+            assert processor._index.ready.wait(5)
+            with patch("music_downloader.processor.file_handler._find_by_name", return_value=None) as mock_find:
+                assert processor.find_downloaded_file("user", "\\Music\\song.flac") is None
+            mock_find.assert_called_once_with(str(download_dir), "song.flac")
+        finally:
+            processor.close()
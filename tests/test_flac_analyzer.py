@@ -2,11 +2,22 @@
 
 import os
 import tempfile
+from unittest.mock import patch
 
 import numpy as np
 import soundfile as sf
 
-from music_downloader.processor.flac_analyzer import FlacVerdict, analyze_flac, convert_to_ogg, create_preview_clip
+from music_downloader.processor.flac_analyzer import (
+    _WELCH_NPERSEG,
+    _WELCH_TARGET_SEGMENTS,
+    FlacVerdict,
+    _bit_depth,
+    _find_sustained_drop,
+    _hann,
+    analyze_flac,
+    convert_to_ogg,
+    create_preview_clip,
+)
 
 
 class TestFlacVerdict:
@@ -94,6 +105,24 @@ class TestAnalyzeFlac:
         finally:
             os.unlink(path)
 
+    def test_natural_rolloff_is_not_fake(self):
+        """Broadband audio sitting 27dB below the mid band above 10kHz is not a transcode."""
+        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
+            path = f.name
+        try:
+            sample_rate = 44100
+            rng = np.random.default_rng(42)
+            spectrum = np.fft.rfft(rng.standard_normal(sample_rate * 10))
+            spectrum[np.fft.rfftfreq(sample_rate * 10, d=1 / sample_rate) >= 10000] *= 10 ** (-27 / 20)
+            data = np.fft.irfft(spectrum, sample_rate * 10).astype(np.float32)
+            data = data / np.max(np.abs(data)) * 0.8
+            sf.write(path, data, sample_rate, subtype="PCM_16")
+            result = analyze_flac(path, sample_duration=10.0)
+            assert result is not None
+            assert result.verdict != "FAKE"
+        finally:
+            os.unlink(path)
+
     def test_silent_file_is_authentic(self):
         """A near-silent file should default to AUTHENTIC (can't analyze)."""
         with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
@@ -113,6 +142,51 @@ class TestAnalyzeFlac:
         result = analyze_flac("/tmp/nonexistent_test_file.flac")
         assert result is None
 
+    def test_reads_only_needed_frames(self):
+        """Long files decode just enough audio for the Welch average."""
+        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
+            path = f.name
+        try:
+            self._create_test_flac(path, duration=20.0)
+            with patch("music_downloader.processor.flac_analyzer.sf.read", wraps=sf.read) as mock_read:
+                result = analyze_flac(path, sample_duration=30.0)
+            assert result is not None
+            assert result.verdict == "AUTHENTIC"
+            assert len(mock_read.call_args.kwargs["out"]) == _WELCH_NPERSEG * _WELCH_TARGET_SEGMENTS
+        finally:
+            os.unlink(path)
+
+    def test_very_short_file_still_gets_verdict(self):
+        """Clips shorter than one Welch segment still get a verdict."""
+        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
+            path = f.name
+        try:
+            self._create_test_flac(path, duration=0.05)
+            result = analyze_flac(path)
+            assert result is not None
+            assert result.verdict == "AUTHENTIC"
+        finally:
+            os.unlink(path)
+
+    def test_verdict_is_memoized_until_file_changes(self):
+        """Re-analyzing an unchanged file skips decoding; a rewrite invalidates it."""
+        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
+            path = f.name
+        try:
+            self._create_test_flac(path)
+            with patch("music_downloader.processor.flac_analyzer.sf.info", wraps=sf.info) as mock_info:
+                first = analyze_flac(path, sample_duration=5.0)
+                assert analyze_flac(path, sample_duration=5.0) is first
+                assert mock_info.call_count == 1
+
+                self._create_test_flac(path, cutoff_hz=15000.0)
+                os.utime(path, ns=(0, 0))
+                second = analyze_flac(path, sample_duration=5.0)
+                assert mock_info.call_count == 2
+                assert second.verdict != first.verdict
+        finally:
+            os.unlink(path)
+
     def test_hi_res_authentic(self):
         """96kHz broadband file should be AUTHENTIC with 48kHz Nyquist."""
         with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
@@ -128,6 +202,37 @@ class TestAnalyzeFlac:
             os.unlink(path)
 
 
+class TestBitDepth:
+    def test_known_and_unknown_subtypes(self):
+        assert _bit_depth("PCM_24") == 24
+        assert _bit_depth("FLOAT") == 32
+        assert _bit_depth("ALAC_20") == 20
+        assert _bit_depth("VORBIS") == 0
+        assert _bit_depth(None) == 0
+
+
+class TestHannWindow:
+    def test_window_is_cached_and_read_only(self):
+        window = _hann(1024)
+        assert _hann(1024) is window
+        assert window.dtype == np.float32
+        assert not window.flags.writeable
+
+
+class TestFindSustainedDrop:
+    """Test the vectorized cutoff search."""
+
+    def test_ignores_isolated_dips(self):
+        freqs = np.arange(10, dtype=np.float64) * 1000
+        psd = np.array([0, -50, 0, -50, -50, 0, -50, -50, -50, -50], dtype=np.float64)
+        assert _find_sustained_drop(freqs, psd, -30) == 6000.0
+
+    def test_no_drop_returns_none(self):
+        freqs = np.arange(10, dtype=np.float64)
+        psd = np.array([0, -50, -50, -50, 0, 0, 0, 0, 0, 0], dtype=np.float64)
+        assert _find_sustained_drop(freqs, psd, -30) is None
+
+
 class TestCreatePreviewClip:
     """Test create_preview_clip function."""
 
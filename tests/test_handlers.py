@@ -58,6 +58,12 @@ class TestCleanSearchTitle:
     def test_leaves_normal_title_alone(self):
         assert _clean_search_title("Bohemian Rhapsody") == "Bohemian Rhapsody"
 
+    def test_repeated_titles_are_cached(self):
+        _clean_search_title.cache_clear()
+        _clean_search_title("Hey Jude - Mono")
+        _clean_search_title("Hey Jude - Mono")
+        assert _clean_search_title.cache_info().hits == 1
+
     def test_strips_german_version_with_remix_and_remaster(self):
         assert _clean_search_title("'Helden' - German Version 1989 Remix; 2002 Remaster") == "Helden"
 
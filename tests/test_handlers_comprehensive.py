@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import os
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 import tempfile
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,7 +25,7 @@ from music_downloader.bot.handlers import (
     _has_non_latin_script,
     _safe_edit,
 )
-from music_downloader.metadata.spotify import TrackInfo
+from music_downloader.metadata.spotify import TrackInfo, _TokenBucket
 from music_downloader.search.slskd_client import SearchResult
 
 
@@ -937,8 +939,7 @@ class TestMusicBotDoSearch:
     @pytest.mark.asyncio
     async def test_multiple_spotify_results(self, mock_slskd, mock_spotify):
         bot = MusicBot(_make_config())
-        tracks = [_make_track(), _make_track()]
-        tracks[1].album = "Different Album"
+        tracks = [_make_track(), dataclasses.replace(_make_track(), album="Different Album")]
         bot.spotify = MagicMock()
         bot.spotify.search_multiple = MagicMock(return_value=tracks)
         update = _make_update()
@@ -1006,6 +1007,36 @@ class TestMusicBotDoSearch:
         # Should filter to only Nancy Sinatra -> single result -> auto slskd search
         bot._do_slskd_search.assert_called_once()
 
+    @patch("music_downloader.bot.handlers.SpotifyResolver")
+    @patch("music_downloader.bot.handlers.SlskdClient")
+    @pytest.mark.asyncio
+    async def test_drained_rate_limit_does_not_block_loop(self, mock_slskd, mock_spotify):
+        """A Spotify lookup waiting on the token bucket must not stall other coroutines."""
+        bucket = _TokenBucket(rate=5.0, capacity=1)
+        bucket.acquire()  # drain: the next acquire sleeps ~0.2s
+
+        def search_multiple(query, limit):
+            bucket.acquire()
+            return []
+
+        bot = MusicBot(_make_config())
+        bot.spotify = MagicMock()
+        bot.spotify.search_multiple = MagicMock(side_effect=search_multiple)
+        update = _make_update()
+        context = _make_context()
+        msg = AsyncMock()
+        msg.edit_text = AsyncMock()
+        context.bot.send_message = AsyncMock(return_value=msg)
+        bot._chat_generation[67890] = 0
+
+        task = asyncio.create_task(bot._do_search(update, context, "test", 0))
+        started = time.monotonic()
+        await asyncio.sleep(0.01)
+        assert time.monotonic() - started < 0.1
+        assert not task.done()
+        await task
+        bot.spotify.search_multiple.assert_called_once_with("test", limit=50)
+
 
 class TestMusicBotDismissOtherDownloads:
     @patch("music_downloader.bot.handlers.SpotifyResolver")
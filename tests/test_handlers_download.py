@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import tempfile
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -118,6 +121,38 @@ class TestDoSlskdSearch:
         await bot._do_slskd_search(context, 123, _make_track(), msg, 0)
         assert 123 in bot.pending
 
+    @patch("music_downloader.bot.handlers.SpotifyResolver")
+    @patch("music_downloader.bot.handlers.SlskdClient")
+    @pytest.mark.asyncio
+    async def test_search_overlaps_status_edit(self, mock_slskd_cls, mock_spotify):
+        """The slskd search starts without waiting for the first status edit."""
+        bot = MusicBot(_make_config())
+        search_started = asyncio.Event()
+
+        async def fake_search(*args, **kwargs):
+            search_started.set()
+            return [{"responses": []}]
+
+        async def slow_edit(*args, **kwargs):
+            # Only completes once the search is already in flight
+            await asyncio.wait_for(search_started.wait(), timeout=1)
+
+        results = [_make_result(0)]
+        bot.slskd = AsyncMock()
+        bot.slskd.search = fake_search
+        bot.slskd.parse_results = MagicMock(return_value=results)
+        bot.scorer = MagicMock()
+        bot.scorer.score_results = MagicMock(return_value=results)
+        bot._chat_generation[123] = 0
+
+        msg = AsyncMock()
+        msg.edit_text = AsyncMock(side_effect=slow_edit)
+        msg.message_id = 1
+
+        await bot._do_slskd_search(_make_context(), 123, _make_track(), msg, 0)
+        assert 123 in bot.pending
+        assert msg.edit_text.await_count == 2
+
     @patch("music_downloader.bot.handlers.SpotifyResolver")
     @patch("music_downloader.bot.handlers.SlskdClient")
     @pytest.mark.asyncio
@@ -615,31 +650,114 @@ class TestAsyncHelpers:
     @pytest.mark.asyncio
     async def test_embed_spotify_artwork_success(self, mock_slskd_cls, mock_spotify):
         bot = MusicBot(_make_config())
-        with patch("music_downloader.bot.handlers.fetch_spotify_artwork") as mock_fetch:
+        with (
+            patch("music_downloader.bot.handlers.has_artwork", return_value=False),
+            patch("music_downloader.bot.handlers.fetch_spotify_artwork") as mock_fetch,
+        ):
             mock_fetch.return_value = b"\xff\xd8\xff\xe0"
             with patch("music_downloader.bot.handlers.embed_artwork_into_file") as mock_embed:
                 mock_embed.return_value = True
                 await bot._embed_spotify_artwork("/fake/path.flac", _make_track())
+                mock_embed.assert_called_once_with("/fake/path.flac", b"\xff\xd8\xff\xe0")
 
     @patch("music_downloader.bot.handlers.SpotifyResolver")
     @patch("music_downloader.bot.handlers.SlskdClient")
     @pytest.mark.asyncio
     async def test_embed_spotify_artwork_no_art(self, mock_slskd_cls, mock_spotify):
         bot = MusicBot(_make_config())
-        with patch("music_downloader.bot.handlers.fetch_spotify_artwork") as mock_fetch:
+        with (
+            patch("music_downloader.bot.handlers.has_artwork", return_value=False),
+            patch("music_downloader.bot.handlers.fetch_spotify_artwork") as mock_fetch,
+            patch("music_downloader.bot.handlers.embed_artwork_into_file") as mock_embed,
+        ):
             mock_fetch.return_value = None
             await bot._embed_spotify_artwork("/fake/path.flac", _make_track())
+        mock_embed.assert_not_called()
+
+    @patch("music_downloader.bot.handlers.SpotifyResolver")
+    @patch("music_downloader.bot.handlers.SlskdClient")
+    @pytest.mark.asyncio
+    async def test_embed_spotify_artwork_skips_tagged_file(self, mock_slskd_cls, mock_spotify):
+        bot = MusicBot(_make_config())
+        with (
+            patch("music_downloader.bot.handlers.has_artwork", return_value=True),
+            patch("music_downloader.bot.handlers.fetch_spotify_artwork") as mock_fetch,
+        ):
+            await bot._embed_spotify_artwork("/fake/path.flac", _make_track())
+        mock_fetch.assert_not_called()
+
+    @patch("music_downloader.bot.handlers.SpotifyResolver")
+    @patch("music_downloader.bot.handlers.SlskdClient")
+    @pytest.mark.asyncio
+    async def test_embed_spotify_artwork_skips_non_flac_data(self, mock_slskd_cls, mock_spotify, tmp_path):
+        path = tmp_path / "partial.flac"
+        path.write_bytes(b"\x00" * 64)
+        bot = MusicBot(_make_config())
+        with (
+            patch("music_downloader.bot.handlers.fetch_spotify_artwork") as mock_fetch,
+            patch("music_downloader.bot.handlers.embed_artwork_into_file") as mock_embed,
+        ):
+            await bot._embed_spotify_artwork(str(path), _make_track())
+        mock_fetch.assert_not_called()
+        mock_embed.assert_not_called()
 
     @patch("music_downloader.bot.handlers.SpotifyResolver")
     @patch("music_downloader.bot.handlers.SlskdClient")
     @pytest.mark.asyncio
     async def test_embed_spotify_artwork_exception(self, mock_slskd_cls, mock_spotify):
         bot = MusicBot(_make_config())
-        with patch("music_downloader.bot.handlers.fetch_spotify_artwork") as mock_fetch:
+        with (
+            patch("music_downloader.bot.handlers.has_artwork", return_value=False),
+            patch("music_downloader.bot.handlers.fetch_spotify_artwork") as mock_fetch,
+        ):
             mock_fetch.side_effect = Exception("network error")
             # Should not raise
             await bot._embed_spotify_artwork("/fake/path.flac", _make_track())
 
+    @patch("music_downloader.bot.handlers.SpotifyResolver")
+    @patch("music_downloader.bot.handlers.SlskdClient")
+    @pytest.mark.asyncio
+    async def test_background_artwork_is_bounded(self, mock_slskd_cls, mock_spotify):
+        bot = MusicBot(_make_config())
+        running = peak = 0
+        lock = threading.Lock()
+
+        def slow_fetch(*_args):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        with (
+            patch("music_downloader.bot.handlers.has_artwork", return_value=False),
+            patch("music_downloader.bot.handlers.fetch_spotify_artwork", side_effect=slow_fetch),
+        ):
+            for i in range(10):
+                bot._embed_artwork_in_background(f"/fake/{i}.flac", _make_track())
+            assert len(bot._artwork_tasks) == 10
+            await asyncio.gather(*bot._artwork_tasks)
+
+        assert peak == 4
+        assert not bot._artwork_tasks
+
+    @patch("music_downloader.bot.handlers.SpotifyResolver")
+    @patch("music_downloader.bot.handlers.SlskdClient")
+    @pytest.mark.asyncio
+    async def test_wait_for_artwork_finishes_pending_embeds(self, mock_slskd_cls, mock_spotify):
+        bot = MusicBot(_make_config())
+        with (
+            patch("music_downloader.bot.handlers.has_artwork", return_value=False),
+            patch("music_downloader.bot.handlers.fetch_spotify_artwork", return_value=b"img"),
+            patch("music_downloader.bot.handlers.embed_artwork_into_file", return_value=True) as mock_embed,
+        ):
+            bot._embed_artwork_in_background("/fake/path.flac", _make_track())
+            await bot.wait_for_artwork()
+        mock_embed.assert_called_once_with("/fake/path.flac", b"img")
+        assert not bot._artwork_tasks
+
 
 class TestCreateBot:
     def test_creates_application(self):
@@ -648,6 +766,8 @@ class TestCreateBot:
             mock_builder = MagicMock()
             mock_app = MagicMock()
             mock_builder.token.return_value = mock_builder
+            mock_builder.post_init.return_value = mock_builder
+            mock_builder.post_shutdown.return_value = mock_builder
             mock_builder.build.return_value = mock_app
             mock_app_cls.builder.return_value = mock_builder
 
@@ -656,3 +776,57 @@ class TestCreateBot:
             mock_app.add_handler.assert_called()
             # Should have 7 command handlers + 1 callback + 1 message = 9
             assert mock_app.add_handler.call_count == 9
+
+    async def test_post_init_warms_up_connections(self):
+        config = _make_config()
+        with patch("music_downloader.bot.handlers.Application") as mock_app_cls:
+            mock_builder = MagicMock()
+            mock_builder.token.return_value = mock_builder
+            mock_builder.post_init.return_value = mock_builder
+            mock_builder.post_shutdown.return_value = mock_builder
+            mock_app_cls.builder.return_value = mock_builder
+
+            create_bot(config)
+
+        post_init = mock_builder.post_init.call_args[0][0]
+        application = MagicMock()
+        application.create_task.side_effect = lambda coro: coro.close()
+        await post_init(application)
+        assert application.create_task.call_count == 2
+
+    async def test_post_shutdown_stops_download_watcher(self):
+        config = _make_config()
+        with (
+            patch("music_downloader.bot.handlers.Application") as mock_app_cls,
+            patch("music_downloader.bot.handlers.FileProcessor") as mock_processor_cls,
+        ):
+            mock_builder = MagicMock()
+            mock_builder.token.return_value = mock_builder
+            mock_builder.post_init.return_value = mock_builder
+            mock_builder.post_shutdown.return_value = mock_builder
+            mock_app_cls.builder.return_value = mock_builder
+
+            create_bot(config)
+
+        post_shutdown = mock_builder.post_shutdown.call_args[0][0]
+        await post_shutdown(MagicMock())
+        mock_processor_cls.return_value.close.assert_called_once()
+
+    async def test_post_shutdown_waits_for_artwork(self):
+        config = _make_config()
+        with (
+            patch("music_downloader.bot.handlers.Application") as mock_app_cls,
+            patch("music_downloader.bot.handlers.MusicBot") as mock_bot_cls,
+        ):
+            mock_builder = MagicMock()
+            mock_builder.token.return_value = mock_builder
+            mock_builder.post_init.return_value = mock_builder
+            mock_builder.post_shutdown.return_value = mock_builder
+            mock_app_cls.builder.return_value = mock_builder
+            mock_bot_cls.return_value.wait_for_artwork = AsyncMock()
+
+            create_bot(config)
+
+        post_shutdown = mock_builder.post_shutdown.call_args[0][0]
+        await post_shutdown(MagicMock())
+        mock_bot_cls.return_value.wait_for_artwork.assert_awaited_once()
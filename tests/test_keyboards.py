@@ -1,5 +1,7 @@
 """Tests for inline keyboard builders."""
 
+import pytest
+
 from music_downloader.bot.keyboards import (
     build_approve_keyboard,
     build_auto_mode_keyboard,
@@ -92,6 +94,10 @@ class TestBuildResultsKeyboard:
         assert len(action_row) == 1
         assert "Cancel" in action_row[0].text
 
+    def test_page_args_are_keyword_only(self):
+        with pytest.raises(TypeError):
+            build_results_keyboard([_make_result()], 10)
+
 
 class TestBuildApproveKeyboard:
     def test_has_approve_and_reject(self):
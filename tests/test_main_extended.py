@@ -3,7 +3,18 @@
 import os
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from music_downloader.__main__ import _start_health_server, cmd_run
+from music_downloader.config import get_config
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    get_config.cache_clear()
+    yield
+    # Don't leak the Config built from the patched environment into later tests
+    get_config.cache_clear()
 
 
 class TestStartHealthServer:
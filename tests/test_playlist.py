@@ -204,6 +204,21 @@ class TestResolvePlaylist:
         assert result.tracks[1].artist == "A2"
         mock_spotify.sp.next.assert_called_once_with(page1)
 
+    def test_uses_embedded_first_page(self, playlist_resolver, mock_spotify):
+        page2 = {"items": [_make_playlist_track("A2", "S2")], "next": None}
+        mock_spotify.sp.playlist.return_value = {
+            "name": "Big Playlist",
+            "owner": {"display_name": "Owner"},
+            "external_urls": {"spotify": ""},
+            "tracks": {"items": [_make_playlist_track("A1", "S1")], "next": "https://api.spotify.com/v1/next"},
+        }
+        mock_spotify.sp.next.return_value = page2
+
+        result = playlist_resolver._resolve_playlist("p3")
+
+        assert [t.artist for t in result.tracks] == ["A1", "A2"]
+        mock_spotify.sp.playlist_tracks.assert_not_called()
+
     def test_skips_track_with_no_artists(self, playlist_resolver, mock_spotify):
         mock_spotify.sp.playlist.return_value = {
             "name": "P",
@@ -3,17 +3,17 @@
 import pytest
 
 from music_downloader.metadata.spotify import TrackInfo
-from music_downloader.search.scorer import ResultScorer
+from music_downloader.search.scorer import ResultScorer, _filename_words
 from music_downloader.search.slskd_client import SearchResult
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scorer():
     """Create a scorer with default settings."""
     return ResultScorer(duration_tolerance_secs=5)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def track():
     """Create a reference track (Nancy Sinatra - Bang Bang)."""
     return TrackInfo(
@@ -26,6 +26,10 @@ def track():
     )
 
 
+# slskd-style remote folder every test result lives in
+_REMOTE_PREFIX = "\\Music\\Nancy Sinatra\\"
+
+
 def make_result(
     filename: str = "Nancy Sinatra - Bang Bang.flac",
     length: int = 162,
@@ -35,11 +39,12 @@ def make_result(
     has_free_slot: bool = True,
     upload_speed: int = 1_000_000,
     queue_length: int = 0,
+    username: str = "testuser",
 ) -> SearchResult:
     """Helper to create a SearchResult."""
     return SearchResult(
-        username="testuser",
-        filename=f"\\Music\\Nancy Sinatra\\{filename}",
+        username=username,
+        filename=_REMOTE_PREFIX + filename,
         size=size,
         bit_rate=900,
         bit_depth=bit_depth,
@@ -51,51 +56,108 @@ def make_result(
     )
 
 
+ACOUSTIC_TRACK = TrackInfo(
+    artist="Some Artist",
+    title="My Acoustic Song",
+    album="Album",
+    duration_ms=200_000,
+    spotify_url="",
+    year="2024",
+)
+
+# (make_result kwargs, reference track or None for the default, expected result count,
+#  score the single result must exceed or None)
+SINGLE_RESULT_CASES = [
+    pytest.param({"length": 162}, None, 1, 70, id="perfect_match_scores_high"),
+    pytest.param({"length": 300}, None, 0, None, id="duration_mismatch_excluded"),
+    pytest.param(
+        {"filename": "Nancy Sinatra - Bang Bang (Live at Radio City).flac"},
+        None,
+        0,
+        None,
+        id="live_version_excluded",
+    ),
+    pytest.param(
+        {"filename": "Nancy Sinatra - Bang Bang (DJ Remix).flac"},
+        None,
+        0,
+        None,
+        id="remix_excluded",
+    ),
+    # If the original title contains the keyword, don't exclude it
+    pytest.param(
+        {"filename": "Some Artist - My Acoustic Song.flac", "length": 200},
+        ACOUSTIC_TRACK,
+        1,
+        None,
+        id="keyword_in_original_title_not_excluded",
+    ),
+    # Keywords only match at the start of a word
+    pytest.param(
+        {"filename": "Nancy Sinatra - Bang Bang (Discover Oliver Demos).flac"},
+        None,
+        0,
+        None,
+        id="keyword_prefix_of_word_excluded",
+    ),
+    pytest.param(
+        {"filename": "Nancy Sinatra - Bang Bang [Oliver Discovery].flac"},
+        None,
+        1,
+        None,
+        id="keyword_inside_word_not_excluded",
+    ),
+    # Underscores separate words in many Soulseek filenames
+    pytest.param(
+        {"filename": "bang_bang_remix.flac"},
+        None,
+        0,
+        None,
+        id="keyword_after_underscore_excluded",
+    ),
+    pytest.param(
+        {"filename": "nancy_sinatra_-_bang_bang_live.flac"},
+        None,
+        0,
+        None,
+        id="live_after_underscore_excluded",
+    ),
+    pytest.param(
+        {"filename": "01_remix.flac"},
+        None,
+        0,
+        None,
+        id="keyword_after_track_number_underscore_excluded",
+    ),
+    # Results without duration info get a moderate score, not excluded
+    pytest.param({"length": None}, None, 1, 0, id="no_duration_neutral_score"),
+]
+
+
 class TestResultScorer:
     """Tests for ResultScorer."""
 
-    def test_perfect_match_scores_high(self, scorer, track):
-        """A perfect match should score high."""
-        result = make_result(length=162)
-        scored = scorer.score_results([result], track)
-        assert len(scored) == 1
-        assert scored[0].score > 70
-
-    def test_duration_mismatch_excluded(self, scorer, track):
-        """A result with very different duration should be excluded."""
-        result = make_result(length=300)  # 5 minutes vs 2:42
-        scored = scorer.score_results([result], track)
-        assert len(scored) == 0
-
-    def test_live_version_excluded(self, scorer, track):
-        """Results with 'live' in filename should be excluded."""
-        result = make_result(filename="Nancy Sinatra - Bang Bang (Live at Radio City).flac")
-        scored = scorer.score_results([result], track)
-        assert len(scored) == 0
-
-    def test_remix_excluded(self, scorer, track):
-        """Results with 'remix' in filename should be excluded."""
-        result = make_result(filename="Nancy Sinatra - Bang Bang (DJ Remix).flac")
-        scored = scorer.score_results([result], track)
-        assert len(scored) == 0
-
-    def test_keyword_in_original_title_not_excluded(self, scorer):
-        """If the original title contains the keyword, don't exclude it."""
-        # Track title actually contains "Acoustic"
-        acoustic_track = TrackInfo(
+    @pytest.mark.parametrize(("kwargs", "ref_track", "expected_count", "score_above"), SINGLE_RESULT_CASES)
+    def test_single_result(self, scorer, track, kwargs, ref_track, expected_count, score_above):
+        scored = scorer.score_results([make_result(**kwargs)], ref_track or track)
+        assert len(scored) == expected_count
+        if score_above is not None:
+            assert scored[0].score > score_above
+
+    def test_keyword_in_title_does_not_shield_other_keywords(self, scorer):
+        """A title keyword is allowed, but other keywords in the filename still exclude."""
+        live_track = TrackInfo(
             artist="Some Artist",
-            title="My Acoustic Song",
+            title="Song (Live)",
             album="Album",
             duration_ms=200_000,
             spotify_url="",
             year="2024",
         )
-        result = make_result(
-            filename="Some Artist - My Acoustic Song.flac",
-            length=200,
-        )
-        scored = scorer.score_results([result], acoustic_track)
-        assert len(scored) == 1
+        live = make_result(filename="Some Artist - Song (Live).flac", length=200)
+        remix = make_result(filename="Some Artist - Song (Live) (Remix).flac", length=200)
+        scored = scorer.score_results([live, remix], live_track)
+        assert [r.basename for r in scored] == ["Some Artist - Song (Live).flac"]
 
     def test_close_duration_preferred(self, scorer, track):
         """Results closer in duration should score higher."""
@@ -124,16 +186,46 @@ class TestResultScorer:
 
     def test_deduplication(self, scorer, track):
         """Duplicate basenames should be deduplicated (keep highest score)."""
-        good = make_result(has_free_slot=True, upload_speed=5_000_000)
-        bad = make_result(has_free_slot=False, upload_speed=100_000)
-        bad.username = "slowuser"
+        good = make_result(upload_speed=5_000_000)
+        bad = make_result(has_free_slot=False, upload_speed=100_000, username="slowuser")
         scored = scorer.score_results([good, bad], track)
         assert len(scored) == 1
         assert scored[0].username == "testuser"
 
-    def test_no_duration_info_gets_neutral_score(self, scorer, track):
-        """Results without duration info should get a moderate score, not excluded."""
-        result = make_result(length=None)
-        scored = scorer.score_results([result], track)
+    def test_deduplication_replaces_lower_scored_earlier_result(self, scorer, track):
+        """A later, better-scored duplicate (case-insensitive) replaces the earlier one."""
+        bad = make_result(
+            filename="NANCY SINATRA - BANG BANG.FLAC", has_free_slot=False, upload_speed=100_000, username="slowuser"
+        )
+        good = make_result(upload_speed=5_000_000)
+        scored = scorer.score_results([bad, good], track)
         assert len(scored) == 1
-        assert scored[0].score > 0
+        assert scored[0].username == "testuser"
+
+    def test_equal_scores_keep_input_order(self, scorer, track):
+        """Tied results stay in input order, using the position of the surviving duplicate."""
+        slow = make_result(has_free_slot=False, upload_speed=100_000, username="slowuser")
+        other = make_result(filename="01 - Nancy Sinatra - Bang Bang.flac", username="otheruser")
+        fast = make_result(username="fastuser")
+        scored = scorer.score_results([slow, other, fast], track)
+        assert scored[0].score == scored[1].score
+        assert [r.username for r in scored] == ["otheruser", "fastuser"]
+
+    def test_custom_keywords_match_at_word_starts(self, track):
+        """Custom keywords (including multi-word ones) match at word starts and may run on into the word."""
+        scorer = ResultScorer(exclude_keywords=["remaster", "radio edit"])
+        remastered = make_result(filename="Nancy Sinatra - Bang Bang (Remastered).flac")
+        radio = make_result(filename="Nancy Sinatra - Bang Bang (Radio Edit).flac")
+        clean = make_result(filename="Nancy Sinatra - Bang Bang (Live).flac")
+        scored = scorer.score_results([remastered, radio, clean], track)
+        assert [r.basename for r in scored] == ["Nancy Sinatra - Bang Bang (Live).flac"]
+
+    def test_rescoring_gives_identical_scores(self, track):
+        """Scoring the same results again (memoized text terms included) gives the same scores."""
+        _filename_words.cache_clear()
+        scorer = ResultScorer()
+        results = [make_result(length=162), make_result(length=170, filename="Nancy Sinatra - Bang Bang v2.flac")]
+        first = [r.score for r in scorer.score_results(results, track)]
+        assert [r.score for r in scorer.score_results(results, track)] == first
+        _filename_words.cache_clear()
+        assert [r.score for r in scorer.score_results(results, track, max_duration_diff=60)] == first
@@ -1,14 +1,19 @@
 """Tests for slskd API client."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import dataclasses
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import requests.exceptions
 
 from music_downloader.search.slskd_client import (
     ActiveDownload,
     DownloadStatus,
     SearchResult,
     SlskdClient,
+    SlskdUnavailableError,
 )
 
 
@@ -77,6 +82,11 @@ class TestSearchResult:
         r = SearchResult(username="u", filename="f.flac", size=100)
         assert r.quality_display == "FLAC"
 
+    def test_display_strings_are_cached(self):
+        r = SearchResult(username="u", filename="f.flac", size=100, bit_depth=16, sample_rate=44100, length=185)
+        assert r.quality_display is r.quality_display
+        assert r.duration_display is r.duration_display
+
     def test_str(self):
         r = SearchResult(
             username="u",
@@ -101,6 +111,21 @@ class TestSearchResult:
         assert "16bit/44.1kHz" in r.quality_display
         assert "kbps" not in r.quality_display
 
+    def test_basename_and_extension_cached(self):
+        r = SearchResult(username="u", filename="\\Music\\Song.FLAC", size=100)
+        assert r.basename is r.basename
+        assert r.extension == "flac"
+        assert r._basename == "Song.FLAC"
+        assert r._extension == "flac"
+
+    def test_slotted_and_display_cache_hidden_from_equality(self):
+        a = SearchResult(username="u", filename="f.flac", size=100, length=180)
+        b = SearchResult(username="u", filename="f.flac", size=100, length=180)
+        assert not hasattr(a, "__dict__")
+        assert a.duration_display == "3:00"
+        assert a == b
+        assert "_duration_display" not in repr(a)
+
 
 class TestDownloadStatus:
     """Test DownloadStatus dataclass properties."""
@@ -149,6 +174,17 @@ class TestDownloadStatus:
         s = DownloadStatus(username="u", filename="f", state="Errored")
         assert s.is_active is False
 
+    def test_state_tokens_are_whole_words(self):
+        s = DownloadStatus(username="u", filename="f", state="Completed, Errored")
+        assert s.is_complete is True
+        assert s.is_failed is True
+        assert DownloadStatus(username="u", filename="f", state="Queued, Remotely").is_active is True
+
+    def test_frozen(self):
+        s = DownloadStatus(username="u", filename="f", state="Errored")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            s.state = "Completed"
+
 
 class TestActiveDownload:
     """Test ActiveDownload dataclass."""
@@ -232,6 +268,37 @@ class TestSlskdClientParseResults:
         assert results[0].upload_speed == 9_000_000
         assert results[0].queue_length == 3
 
+    def test_parse_matches_extension_case_insensitively(self, client):
+        responses = [
+            {
+                "username": "u",
+                "files": [
+                    {"filename": "\\Song.FLAC", "size": 1},
+                    {"filename": "\\Song.Mp3", "size": 1},
+                    {"filename": "\\flac.d\\notes", "size": 1},
+                ],
+            }
+        ]
+        assert [r.basename for r in client.parse_results(responses, flac_only=True)] == ["Song.FLAC"]
+        assert len(client.parse_results(responses, flac_only=False)) == 2
+
+    def test_fallback_reuses_parse_of_same_responses(self, client):
+        responses = [
+            {
+                "username": "u",
+                "files": [{"filename": "\\Song.flac", "size": 1}, {"filename": "\\Song.mp3", "size": 1}],
+            }
+        ]
+        flac = client.parse_results(responses, flac_only=True)
+        with patch("music_downloader.search.slskd_client.SearchResult") as mock_result:
+            audio = client.parse_results(responses, flac_only=False)
+        mock_result.assert_not_called()
+        assert audio[0] is flac[0]
+        assert [r.extension for r in audio] == ["flac", "mp3"]
+
+        # A different list with equal contents is parsed afresh
+        assert client.parse_results(list(responses), flac_only=True)[0] is not flac[0]
+
     def test_parse_missing_fields(self, client):
         responses = [
             {
@@ -275,6 +342,64 @@ class TestSlskdClientEnqueue:
         assert client.enqueue_download(result) is False
 
 
+class TestSlskdClientSession:
+    """Test the HTTP session tuning applied to slskd-api."""
+
+    def test_shared_session_gets_pooled_adapter_with_timeout(self):
+        c = SlskdClient("http://localhost:5030", "test-key")
+        session = c.client.transfers.session
+        assert session is c.client.searches.session
+        adapter = session.get_adapter("http://localhost:5030/api/v0/transfers")
+        assert adapter.timeout == 60.0
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 2
+        assert "POST" not in adapter.max_retries.allowed_methods
+
+
+class TestSlskdClientLazyInit:
+    def test_client_built_on_first_use(self):
+        with patch("slskd_api.SlskdClient") as mock_cls:
+            c = SlskdClient("http://localhost:5030", "test-key")
+            mock_cls.assert_not_called()
+            assert c.client is c.client
+        mock_cls.assert_called_once_with("http://localhost:5030", "test-key")
+
+
+class TestSlskdClientPing:
+    """Test SlskdClient.ping warm-up request."""
+
+    @pytest.fixture
+    def client(self):
+        with patch("slskd_api.SlskdClient") as mock_cls:
+            c = SlskdClient("http://localhost:5030", "test-key")
+            c.client = mock_cls.return_value
+            return c
+
+    @pytest.mark.asyncio
+    async def test_ping_success(self, client):
+        assert await client.ping() is True
+        client.client.application.version.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_call_runs_on_dedicated_executor(self, client):
+        def whoami(prefix, *, suffix):
+            return prefix + threading.current_thread().name + suffix
+
+        name = await client._call(whoami, "<", suffix=">")
+        assert name.startswith("<slskd") and name.endswith(">")
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_executor(self, client):
+        client.close()
+        with pytest.raises(RuntimeError):
+            await client._call(lambda: None)
+
+    @pytest.mark.asyncio
+    async def test_ping_failure(self, client):
+        client.client.application.version = MagicMock(side_effect=Exception("Connection refused"))
+        assert await client.ping() is False
+
+
 class TestSlskdClientGetDownloadStatus:
     """Test SlskdClient.get_download_status."""
 
@@ -319,12 +444,65 @@ class TestSlskdClientGetDownloadStatus:
         status = client.get_download_status("user1", "\\Music\\Song.flac")
         assert status is None
 
+    def test_status_reuses_recent_fetch_until_enqueue(self, client):
+        client.client.transfers.get_downloads = MagicMock(return_value={"directories": []})
+        client.get_download_status("user1", "a")
+        client.get_download_status("user1", "b")
+        assert client.client.transfers.get_downloads.call_count == 1
+
+        client.enqueue_download(SearchResult(username="user1", filename="\\c.flac", size=1))
+        client.get_download_status("user1", "c")
+        assert client.client.transfers.get_downloads.call_count == 2
+
+    def test_expired_listings_are_pruned(self, client):
+        client.client.transfers.get_downloads = MagicMock(return_value={"directories": []})
+        with patch("music_downloader.search.slskd_client.time.monotonic", return_value=100.0):
+            client.get_download_status("user1", "a")
+            client.get_download_status("user2", "a")
+        with patch("music_downloader.search.slskd_client.time.monotonic", return_value=102.0):
+            client.get_download_status("user3", "a")
+        assert list(client._response_cache) == [("downloads", "user3")]
+
     def test_status_exception(self, client):
         client.client.transfers.get_downloads = MagicMock(side_effect=Exception("err"))
         status = client.get_download_status("user1", "\\Music\\Song.flac")
         assert status is None
 
 
+class TestSlskdClientGetAllDownloadStatuses:
+    """Test SlskdClient.get_all_download_statuses."""
+
+    @pytest.fixture
+    def client(self):
+        with patch("slskd_api.SlskdClient") as mock_cls:
+            c = SlskdClient("http://localhost:5030", "test-key")
+            c.client = mock_cls.return_value
+            return c
+
+    def test_keys_by_user_and_filename(self, client):
+        client.client.transfers.get_all_downloads = MagicMock(
+            return_value=[
+                {"username": "u1", "directories": [{"files": [{"filename": "\\A.flac", "state": "InProgress"}]}]},
+                {"username": "u2", "directories": [{"files": [{"filename": "\\A.flac", "state": "Completed"}]}]},
+            ]
+        )
+        statuses = client.get_all_download_statuses()
+        assert statuses[("u1", "\\A.flac")].is_active
+        assert statuses[("u2", "\\A.flac")].is_complete
+
+    def test_only_requested_keys(self, client):
+        client.client.transfers.get_all_downloads = MagicMock(
+            return_value=[
+                {"username": "u1", "directories": [{"files": [{"filename": "a"}, {"filename": "b"}]}]},
+            ]
+        )
+        assert list(client.get_all_download_statuses({("u1", "b")})) == [("u1", "b")]
+
+    def test_exception_returns_empty(self, client):
+        client.client.transfers.get_all_downloads = MagicMock(side_effect=Exception("err"))
+        assert client.get_all_download_statuses() == {}
+
+
 class TestSlskdClientSearch:
     """Test SlskdClient.search async method."""
 
@@ -335,6 +513,25 @@ class TestSlskdClientSearch:
             c.client = mock_cls.return_value
             return c
 
+    @pytest.mark.asyncio
+    async def test_search_returns_inner_results(self, client):
+        client._search_inner = AsyncMock(return_value=[{"username": "u"}])
+        assert await client.search("q", timeout_secs=2) == [{"username": "u"}]
+        client._search_inner.assert_awaited_once_with("q", 2, 500)
+
+    @pytest.mark.asyncio
+    async def test_unreachable_fails_fast_for_a_few_seconds(self, client):
+        client._search_inner = AsyncMock(side_effect=requests.exceptions.ConnectionError("down"))
+        with pytest.raises(SlskdUnavailableError):
+            await client.search("q", timeout_secs=2)
+        with pytest.raises(SlskdUnavailableError):
+            await client.search("q", timeout_secs=2)
+        client._search_inner.assert_awaited_once()
+
+        client._unavailable_until = 0.0
+        client._search_inner = AsyncMock(return_value=[])
+        assert await client.search("q", timeout_secs=2) == []
+
     @pytest.mark.asyncio
     async def test_search_exception_returns_empty(self, client):
         """search() should return empty list on exception."""
@@ -388,14 +585,18 @@ class TestSlskdClientWaitForDownload:
         )
         call_count = 0
 
-        def mock_get_status(username, filename):
+        def mock_statuses(_keys):
             nonlocal call_count
             call_count += 1
             if call_count >= 2:
-                return completed
-            return DownloadStatus(username="u", filename="f.flac", state="InProgress", percent_complete=50)
+                return {("u", "f.flac"): completed}
+            return {
+                ("u", "f.flac"): DownloadStatus(
+                    username="u", filename="f.flac", state="InProgress", percent_complete=50
+                )
+            }
 
-        client.get_download_status = mock_get_status
+        client.get_all_download_statuses = mock_statuses
         result = await client.wait_for_download("u", "f.flac", timeout_secs=10)
         assert result is not None
         assert result.is_complete
@@ -404,33 +605,146 @@ class TestSlskdClientWaitForDownload:
     async def test_wait_fails(self, client):
         """wait_for_download returns failed status."""
         failed = DownloadStatus(username="u", filename="f.flac", state="Errored")
-        client.get_download_status = MagicMock(return_value=failed)
+        client.get_all_download_statuses = MagicMock(return_value={("u", "f.flac"): failed})
         result = await client.wait_for_download("u", "f.flac", timeout_secs=10)
         assert result is not None
         assert result.is_failed
 
     @pytest.mark.asyncio
     async def test_wait_timeout(self, client):
-        """wait_for_download returns None on timeout."""
+        """wait_for_download returns None on timeout and unregisters itself."""
         in_progress = DownloadStatus(username="u", filename="f.flac", state="InProgress")
-        client.get_download_status = MagicMock(return_value=in_progress)
+        client.get_all_download_statuses = MagicMock(return_value={("u", "f.flac"): in_progress})
+        client.cancel_download = MagicMock()
         result = await client.wait_for_download("u", "f.flac", timeout_secs=1)
         assert result is None
+        assert client._download_watchers == {}
+        client.cancel_download.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_wait_no_status_yet(self, client):
-        """wait_for_download handles None status during polling."""
+        """wait_for_download handles a missing status during polling."""
         call_count = 0
         completed = DownloadStatus(username="u", filename="f.flac", state="Completed")
 
-        def mock_status(username, filename):
+        def mock_statuses(_keys):
             nonlocal call_count
             call_count += 1
             if call_count < 2:
-                return None
-            return completed
+                return {}
+            return {("u", "f.flac"): completed}
 
-        client.get_download_status = mock_status
+        client.get_all_download_statuses = mock_statuses
         result = await client.wait_for_download("u", "f.flac", timeout_secs=15)
         assert result is not None
         assert result.is_complete
+
+    @pytest.mark.asyncio
+    async def test_wait_polls_with_backoff(self, client):
+        """Polling starts fast and backs off up to the cap."""
+        done = DownloadStatus(username="u", filename="f.flac", state="Completed")
+        client.get_all_download_statuses = MagicMock(side_effect=[{}] * 9 + [{("u", "f.flac"): done}])
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(secs):
+            delays.append(secs)
+            await real_sleep(0)
+
+        with patch("music_downloader.search.slskd_client.asyncio.sleep", fake_sleep):
+            result = await client.wait_for_download("u", "f.flac", timeout_secs=20)
+
+        assert result is done
+        assert delays[0] == 0.25
+        assert delays == sorted(delays)
+        assert max(delays) == 3.0
+
+    @pytest.mark.asyncio
+    async def test_wait_polls_off_the_event_loop(self, client):
+        """The blocking status request runs in a worker thread."""
+        done = DownloadStatus(username="u", filename="f.flac", state="Completed, Succeeded")
+        threads = []
+
+        def statuses(_keys):
+            threads.append(threading.get_ident())
+            return {("u", "f.flac"): done}
+
+        client.get_all_download_statuses = statuses
+        result = await client.wait_for_download("u", "f.flac", timeout_secs=10)
+        assert result is done
+        assert threads and threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waits_share_one_request_per_tick(self, client):
+        """Parallel waiters are resolved from the same transfers snapshot."""
+        a = DownloadStatus(username="u1", filename="a.flac", state="Completed")
+        b = DownloadStatus(username="u2", filename="b.flac", state="Errored")
+        client.get_all_download_statuses = MagicMock(return_value={("u1", "a.flac"): a, ("u2", "b.flac"): b})
+
+        results = await asyncio.gather(
+            client.wait_for_download("u1", "a.flac", timeout_secs=10),
+            client.wait_for_download("u2", "b.flac", timeout_secs=10),
+        )
+
+        assert results == [a, b]
+        client.get_all_download_statuses.assert_called_once()
+        assert client._download_watchers == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_cancels_transfer(self, client):
+        """Cancelling the waiter cancels the slskd transfer."""
+        client.get_all_download_statuses = MagicMock(return_value={})
+        client.cancel_download = MagicMock(return_value=True)
+
+        task = asyncio.create_task(client.wait_for_download("u", "f.flac", timeout_secs=10))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        client.cancel_download.assert_called_once_with("u", "f.flac")
+        assert client._download_watchers == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_keeps_transfer_with_other_waiters(self, client):
+        client.get_all_download_statuses = MagicMock(return_value={})
+        client.cancel_download = MagicMock(return_value=True)
+
+        first = asyncio.create_task(client.wait_for_download("u", "f.flac", timeout_secs=10))
+        second = asyncio.create_task(client.wait_for_download("u", "f.flac", timeout_secs=10))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        client.cancel_download.assert_not_called()
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        client.cancel_download.assert_called_once()
+
+
+class TestSlskdClientCancelDownload:
+    """Test SlskdClient.cancel_download."""
+
+    @pytest.fixture
+    def client(self):
+        with patch("slskd_api.SlskdClient") as mock_cls:
+            c = SlskdClient("http://localhost:5030", "test-key")
+            c.client = mock_cls.return_value
+            return c
+
+    def test_cancels_active_transfer_by_id(self, client):
+        client.get_download_status = MagicMock(
+            return_value=DownloadStatus(username="u", filename="f", state="InProgress", id="t-1")
+        )
+        client.client.transfers.cancel_download = MagicMock(return_value=True)
+        assert client.cancel_download("u", "f") is True
+        client.client.transfers.cancel_download.assert_called_once_with(username="u", id="t-1")
+
+    def test_finished_transfer_left_alone(self, client):
+        client.get_download_status = MagicMock(
+            return_value=DownloadStatus(username="u", filename="f", state="Completed, Succeeded", id="t-1")
+        )
+        assert client.cancel_download("u", "f") is False
+        client.client.transfers.cancel_download.assert_not_called()
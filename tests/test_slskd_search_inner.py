@@ -1,5 +1,8 @@
 """Tests for SlskdClient._search_inner and _stop_and_collect."""
 
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -77,15 +80,24 @@ class TestSearchInner:
         results = await client._search_inner("test", timeout_secs=10, response_limit=100)
         assert len(results) == 1
 
+    @pytest.mark.asyncio
+    async def test_completed_empty_search_skips_response_fetch(self, client):
+        """A search that completed with no peers returns without fetching responses."""
+        client.client.searches.get_all = MagicMock(return_value=[])
+        client.client.searches.search_text = MagicMock(return_value={"id": "empty"})
+        client.client.searches.state = MagicMock(return_value={"fileCount": 0, "responseCount": 0, "isComplete": True})
+
+        results = await client._search_inner("nothing", timeout_secs=10, response_limit=100)
+
+        assert results == []
+        client.client.searches.stop.assert_not_called()
+        assert all("includeResponses" not in c.kwargs for c in client.client.searches.state.call_args_list)
+        client.client.searches.delete.assert_called_once_with(id="empty")
+
     @pytest.mark.asyncio
     async def test_cleanup_stale_searches(self, client):
         """Stale searches are cleaned up before new search."""
-        client.client.searches.get_all = MagicMock(
-            return_value=[
-                {"id": "old-1"},
-                {"id": "old-2"},
-            ]
-        )
+        client.client.searches.get_all = MagicMock(return_value=[{"id": f"old-{i}"} for i in range(5)])
         client.client.searches.delete = MagicMock()
         client.client.searches.search_text = MagicMock(return_value={"id": "new-1"})
 
@@ -97,8 +109,60 @@ class TestSearchInner:
         client.client.searches.state = MagicMock(side_effect=state_side_effect)
 
         await client._search_inner("test", timeout_secs=5, response_limit=100)
-        # Should have deleted old-1 and old-2 plus the new search
-        assert client.client.searches.delete.call_count >= 2
+        # Should have deleted the five old searches plus the new search
+        assert client.client.searches.delete.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_cleanup_deletes_concurrently(self, client):
+        """Stale searches are deleted in parallel, and one failure doesn't stop the rest."""
+        client.client.searches.get_all = MagicMock(return_value=[{"id": f"old-{i}"} for i in range(6)])
+        barrier = threading.Barrier(2, timeout=5)
+        deleted = []
+
+        def delete(id):
+            if id == "old-0":
+                raise RuntimeError("boom")
+            if id in ("old-1", "old-2"):
+                barrier.wait()  # only returns if both deletes are in flight together
+            deleted.append(id)
+
+        client.client.searches.delete = MagicMock(side_effect=delete)
+        await client._cleanup_stale_searches()
+        assert sorted(deleted) == [f"old-{i}" for i in range(1, 6)]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_recent_searches(self, client):
+        """Only searches older than the minimum age are deleted."""
+        now = datetime.now(UTC)
+        old = (now - timedelta(hours=1)).replace(tzinfo=None).isoformat()
+        recent = (now - timedelta(seconds=10)).isoformat()
+        client.client.searches.get_all = MagicMock(
+            return_value=[
+                {"id": "old-ended", "endedAt": old},
+                {"id": "old-started", "startedAt": old},
+                {"id": "recent", "startedAt": old, "endedAt": recent},
+                {"id": "running", "startedAt": recent},
+                {"id": "unknown"},
+            ]
+        )
+        client.client.searches.delete = MagicMock()
+
+        await client._cleanup_stale_searches()
+
+        deleted = sorted(c.kwargs["id"] for c in client.client.searches.delete.call_args_list)
+        assert deleted == ["old-ended", "old-started", "unknown"]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_skips_few_stale_and_recent_runs(self, client):
+        """A handful of stale searches is left alone, and cleanup is throttled."""
+        client.client.searches.get_all = MagicMock(return_value=[{"id": "old-1"}, {"id": "old-2"}])
+        client.client.searches.delete = MagicMock()
+
+        await client._cleanup_stale_searches()
+        await client._cleanup_stale_searches()
+
+        client.client.searches.get_all.assert_called_once()
+        client.client.searches.delete.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_cleanup_stale_exception_ignored(self, client):
@@ -117,6 +181,22 @@ class TestSearchInner:
         results = await client._search_inner("test", timeout_secs=5, response_limit=100)
         assert isinstance(results, list)
 
+    @pytest.mark.asyncio
+    async def test_cancel_stops_and_deletes_search(self, client):
+        """Cancelling a running search stops and deletes it on slskd."""
+        client.client.searches.get_all = MagicMock(return_value=[])
+        client.client.searches.search_text = MagicMock(return_value={"id": "s-cancel"})
+        client.client.searches.state = MagicMock(return_value={"fileCount": 0, "isComplete": False})
+
+        task = asyncio.create_task(client._search_inner("test", timeout_secs=30, response_limit=100))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        client.client.searches.stop.assert_called_once_with(id="s-cancel")
+        client.client.searches.delete.assert_called_once_with(id="s-cancel")
+
 
 class TestStopAndCollect:
     @pytest.fixture
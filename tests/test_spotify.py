@@ -1,24 +1,27 @@
 """Tests for Spotify metadata resolver."""
 
+import dataclasses
+
 import pytest
 
 from music_downloader.metadata.spotify import TrackInfo
 
 
+@pytest.fixture(scope="module")
+def track():
+    return TrackInfo(
+        artist="Nancy Sinatra",
+        title="Bang Bang (My Baby Shot Me Down)",
+        album="How Does That Grab You?",
+        duration_ms=162000,
+        spotify_url="https://open.spotify.com/track/xxx",
+        year="1966",
+    )
+
+
 class TestTrackInfo:
     """Tests for the TrackInfo dataclass."""
 
-    @pytest.fixture
-    def track(self):
-        return TrackInfo(
-            artist="Nancy Sinatra",
-            title="Bang Bang (My Baby Shot Me Down)",
-            album="How Does That Grab You?",
-            duration_ms=162000,
-            spotify_url="https://open.spotify.com/track/xxx",
-            year="1966",
-        )
-
     def test_duration_secs(self, track):
         assert track.duration_secs == 162
 
@@ -40,3 +43,12 @@ class TestTrackInfo:
         """Test duration display for long tracks."""
         track = TrackInfo("A", "B", "C", 600000, "", "2024")  # 10 minutes
         assert track.duration_display == "10:00"
+
+    def test_is_immutable(self, track):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            track.title = "Other"
+
+    def test_replace_recomputes_derived_fields(self, track):
+        other = dataclasses.replace(track, title="Other", duration_ms=45000)
+        assert other.filename == "Nancy Sinatra - Other"
+        assert (other.duration_secs, other.duration_display) == (45, "0:45")
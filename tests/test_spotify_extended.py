@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 import pytest
 
-from music_downloader.metadata.spotify import SpotifyResolver
+from music_downloader.metadata.spotify import SpotifyResolver, _TokenBucket
 
 
 class TestSpotifyResolver:
@@ -123,3 +123,101 @@ class TestSpotifyResolver:
         result = resolver.search("test")
         assert result is not None
         assert result.year == ""
+
+    def test_warm_up_fetches_token(self, resolver):
+        assert resolver.warm_up() is True
+        resolver.sp.auth_manager.get_access_token.assert_called_once_with(as_dict=False)
+
+    def test_warm_up_failure_returns_false(self, resolver):
+        resolver.sp.auth_manager.get_access_token.side_effect = Exception("bad credentials")
+        assert resolver.warm_up() is False
+
+    def test_search_cache_normalizes_query(self, resolver):
+        resolver.sp.search.return_value = {"tracks": {"items": []}}
+        resolver.search_multiple("Nancy  Sinatra", limit=5)
+        resolver.search_multiple("nancy sinatra", limit=5)
+        assert resolver.sp.search.call_count == 1
+        # A different limit is a different request
+        resolver.search_multiple("nancy sinatra", limit=10)
+        assert resolver.sp.search.call_count == 2
+
+    def test_search_cache_expires(self, resolver):
+        resolver.sp.search.return_value = {"tracks": {"items": []}}
+        resolver._cache_ttl_secs = 0
+        resolver.search("test")
+        resolver.search("test")
+        assert resolver.sp.search.call_count == 2
+
+    def test_search_cache_evicts_oldest(self, resolver):
+        resolver.sp.search.return_value = {"tracks": {"items": []}}
+        resolver._cache_max_entries = 4
+        for q in ("x", "y", "z"):
+            resolver.search(q)
+        assert list(resolver._search_cache) == ["y", ("y",), "z", ("z",)]
+
+    def test_search_cache_fuzzy_match(self, resolver):
+        resolver.sp.search.return_value = {"tracks": {"items": []}}
+        resolver.search_multiple("Nancy Sinatra - Bang Bang", limit=5)
+        resolver.search_multiple("bang bang, (Nancy Sinatra)", limit=5)
+        assert resolver.sp.search.call_count == 1
+        # Dropping a repeated word is a different query
+        resolver.search_multiple("nancy sinatra bang", limit=5)
+        assert resolver.sp.search.call_count == 2
+
+    def test_search_cache_keeps_every_word(self, resolver):
+        resolver.sp.search.return_value = {"tracks": {"items": []}}
+        resolver.search_multiple("India Arie", limit=5)
+        # A song called "Video" must not get the artist-only results
+        resolver.search_multiple("India.Arie - Video", limit=5)
+        resolver.search_multiple("The Beatles", limit=5)
+        resolver.search_multiple("Beatles", limit=5)
+        assert resolver.sp.search.call_count == 4
+
+    def test_search_reuses_larger_cached_response(self, resolver):
+        item = {
+            "artists": [{"name": "Artist"}],
+            "name": "Song",
+            "album": {"name": "Album", "release_date": "2020-01-01"},
+            "duration_ms": 180000,
+            "external_urls": {"spotify": ""},
+        }
+        resolver.sp.search.return_value = {"tracks": {"items": [item, {**item, "name": "Other"}]}}
+        assert len(resolver.search_multiple("artist song", limit=5)) == 2
+        track = resolver.search("Artist Song")
+        assert track.title == "Song"
+        assert resolver.sp.search.call_count == 1
+        # A smaller fetch must not replace the larger cached response
+        resolver._search_cache.clear()
+        resolver.search("artist song")
+        resolver.search_multiple("artist song", limit=5)
+        assert resolver.sp.search.call_count == 3
+        assert resolver._search_cache["artist song"][1] == 5
+
+
+class TestTokenBucket:
+    def test_burst_then_throttle(self):
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(secs):
+            sleeps.append(secs)
+            clock[0] += secs
+
+        with (
+            patch("music_downloader.metadata.spotify.time.monotonic", side_effect=lambda: clock[0]),
+            patch("music_downloader.metadata.spotify.time.sleep", side_effect=fake_sleep),
+        ):
+            bucket = _TokenBucket(rate=2.0, capacity=3)
+            for _ in range(3):
+                bucket.acquire()
+            assert sleeps == []
+            bucket.acquire()
+            bucket.acquire()
+        assert sleeps == [0.5, 0.5]
+
+    def test_resolver_session_is_rate_limited(self):
+        with patch("music_downloader.metadata.spotify.SpotifyClientCredentials"):
+            resolver = SpotifyResolver("test-id", "test-secret")
+        adapter = resolver.sp._session.get_adapter("https://api.spotify.com/v1/search")
+        assert adapter.max_retries.status_forcelist == (429, 500, 502, 503, 504)
+        assert adapter.max_retries.respect_retry_after_header